@@ -0,0 +1,348 @@
+"""Incremental analytics over the application log.
+
+``applied_jobs_log.csv`` only ever grows, so it is read as a stream of typed
+rows and folded into a small summary kept in ``log_summary.json``. The
+summary records the byte offset it has read up to and is checkpointed every
+few thousand rows, so later runs only parse rows appended since. If the log
+is replaced or truncated, the summary is rebuilt from the start.
+
+Run ``python analytics.py`` for a report on the log named in
+``config.json``. It shows the funnel, top skip reasons, applications per
+city per week, distance and salary distributions and time per job. Use
+``--json`` for the raw summary and ``--rebuild`` to start over.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+
+from job_log import LOG_FIELDS, LOG_PATH
+from salary import hourly_wage
+
+log = logging.getLogger(__name__)
+
+SUMMARY_PATH = "log_summary.json"
+SUMMARY_VERSION = 1
+# Rows folded in between summary checkpoints
+CHUNK_ROWS = 5000
+# Bytes of the log start that identify it, so a replaced log is noticed
+HEAD_BYTES = 4096
+
+# Histogram bucket upper bounds; the last bucket is open-ended
+DISTANCE_BUCKETS = [1, 2, 5, 10, 15, 25, 50]
+WAGE_BUCKETS = [12, 15, 17, 20, 25, 30, 40, 60]
+SECONDS_BUCKETS = [5, 10, 20, 30, 60, 120, 300]
+
+
+@dataclass
+class LogRow:
+    """One typed row of the application log."""
+
+    timestamp: datetime | None
+    title: str
+    company: str
+    city: str
+    distance: float | None
+    status: str
+    reason: str
+    wage: float | None
+    seconds: float | None
+
+    @classmethod
+    def parse(cls, record: dict) -> "LogRow":
+        return cls(
+            timestamp=_to_datetime(record.get("timestamp")),
+            title=record.get("job_title", ""),
+            company=record.get("company", ""),
+            city=record.get("city", ""),
+            distance=_to_float(record.get("distance")),
+            status=record.get("status") or "Unknown",
+            reason=record.get("reason", ""),
+            wage=_wage(record.get("salary", "")),
+            seconds=_to_float(record.get("seconds")),
+        )
+
+
+# Salary texts and dates repeat across many rows
+_wage = lru_cache(maxsize=4096)(hourly_wage)
+
+
+@lru_cache(maxsize=4096)
+def _week(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _to_float(value: str | None) -> float | None:
+    try:
+        return float(value) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def _to_datetime(value: str | None) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def bucket(value: float, bounds: list[float]) -> str:
+    for bound in bounds:
+        if value < bound:
+            return f"<{bound}"
+    return f">={bounds[-1]}"
+
+
+def _bump(counts: dict, key: str, amount: int = 1) -> None:
+    counts[key] = counts.get(key, 0) + amount
+
+
+def empty_summary() -> dict:
+    return {
+        "version": SUMMARY_VERSION,
+        "offset": 0,
+        "head_hash": "",
+        "header": None,
+        "rows": 0,
+        "first": None,
+        "last": None,
+        "status": {},
+        "reasons": {},
+        "cities": {},
+        "weeks": {},
+        "distance": {},
+        "wage": {},
+        "seconds": {},
+    }
+
+
+def fold(summary: dict, row: LogRow) -> None:
+    """Add one row to the running summary."""
+    summary["rows"] += 1
+    _bump(summary["status"], row.status)
+    if row.status == "Skipped" or row.status == "Error":
+        _bump(summary["reasons"], f"{row.status}: {row.reason or 'not recorded'}")
+    _bump(summary["cities"].setdefault(row.city or "unknown", {}), row.status)
+    if row.timestamp:
+        stamp = row.timestamp.isoformat()
+        if summary["first"] is None or stamp < summary["first"]:
+            summary["first"] = stamp
+        if summary["last"] is None or stamp > summary["last"]:
+            summary["last"] = stamp
+        if row.status == "Applied":
+            _bump(summary["weeks"].setdefault(_week(row.timestamp.date()), {}), row.city or "unknown")
+    if row.distance is not None:
+        _bump(summary["distance"].setdefault(row.status, {}), bucket(row.distance, DISTANCE_BUCKETS))
+    if row.wage is not None:
+        _bump(summary["wage"].setdefault(row.status, {}), bucket(row.wage, WAGE_BUCKETS))
+    if row.seconds is not None:
+        stats = summary["seconds"].setdefault(
+            row.status, {"count": 0, "total": 0.0, "max": 0.0, "hist": {}}
+        )
+        stats["count"] += 1
+        stats["total"] += row.seconds
+        stats["max"] = max(stats["max"], row.seconds)
+        _bump(stats["hist"], bucket(row.seconds, SECONDS_BUCKETS))
+
+
+def load_summary(path: str = SUMMARY_PATH) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        return empty_summary()
+    return summary if summary.get("version") == SUMMARY_VERSION else empty_summary()
+
+
+def save_summary(summary: dict, path: str = SUMMARY_PATH) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _head_hash(log_path: str, length: int) -> str:
+    with open(log_path, "rb") as f:
+        return hashlib.sha1(f.read(min(length, HEAD_BYTES))).hexdigest()
+
+
+def _is_header(fields: list[str]) -> bool:
+    return fields[0] == LOG_FIELDS[0] and "status" in fields
+
+
+def iter_records(f, start: int):
+    """Yield ``(end_offset, fields)`` for each complete CSV record from ``start``.
+
+    Lines are read in binary so the offset is exact. A record whose quotes
+    are unbalanced continues on the next line, and a final line without a
+    newline (a write in progress) is left for the next run.
+    """
+    f.seek(start)
+    offset = start
+    pending = b""
+    for line in f:
+        if not line.endswith(b"\n"):
+            return
+        pending += line
+        if pending.count(b'"') % 2:
+            continue
+        offset += len(pending)
+        text = pending.decode("utf-8", errors="replace")
+        pending = b""
+        fields = next(csv.reader([text]), None)
+        if fields:
+            yield offset, fields
+
+
+def update_summary(
+    log_path: str, summary_path: str = SUMMARY_PATH, rebuild: bool = False
+) -> tuple[dict, int, bool]:
+    """Fold rows appended to ``log_path`` into the summary.
+
+    Returns the summary, the number of rows added and whether the saved
+    summary was discarded because the log was replaced or truncated.
+    """
+    summary = empty_summary() if rebuild else load_summary(summary_path)
+    if not os.path.exists(log_path):
+        return summary, 0, False
+    size = os.path.getsize(log_path)
+    replaced = bool(summary["offset"]) and (
+        size < summary["offset"] or _head_hash(log_path, summary["offset"]) != summary["head_hash"]
+    )
+    if replaced:
+        log.info("%s was replaced or truncated – rebuilding the summary", log_path)
+        summary = empty_summary()
+
+    added = 0
+    with open(log_path, "rb") as f:
+        for offset, fields in iter_records(f, summary["offset"]):
+            if summary["header"] is None or _is_header(fields):
+                # Concatenated logs repeat the header, maybe with other columns
+                summary["header"] = fields
+            else:
+                fold(summary, LogRow.parse(dict(zip(summary["header"], fields))))
+                added += 1
+            summary["offset"] = offset
+            if added and added % CHUNK_ROWS == 0:
+                summary["head_hash"] = _head_hash(log_path, summary["offset"])
+                save_summary(summary, summary_path)
+    summary["head_hash"] = _head_hash(log_path, summary["offset"])
+    save_summary(summary, summary_path)
+    return summary, added, replaced
+
+
+def _percent(part: int, whole: int) -> str:
+    return f"{100 * part / whole:.1f}%" if whole else "-"
+
+
+def _approx_percentile(hist: dict, count: int, fraction: float) -> str:
+    """Return the bucket holding the given fraction of values."""
+    seen = 0
+    for label in [f"<{b}" for b in SECONDS_BUCKETS] + [f">={SECONDS_BUCKETS[-1]}"]:
+        seen += hist.get(label, 0)
+        if seen >= fraction * count:
+            return label
+    return "-"
+
+
+def _histogram(title: str, by_status: dict, bounds: list[float], unit: str) -> list[str]:
+    labels = [f"<{b}" for b in bounds] + [f">={bounds[-1]}"]
+    statuses = sorted(by_status)
+    lines = [f"{title}:", f"  {unit:>8} " + "".join(f"{s:>10}" for s in statuses)]
+    for label in labels:
+        counts = [by_status[s].get(label, 0) for s in statuses]
+        if any(counts):
+            lines.append(f"  {label:>8} " + "".join(f"{c:>10}" for c in counts))
+    return lines
+
+
+def format_report(summary: dict, weeks: int = 8, top: int = 10) -> str:
+    """Return a plain-text report of the summary."""
+    total = summary["rows"]
+    status = summary["status"]
+    applied = status.get("Applied", 0)
+    lines = [
+        f"Application log: {total} rows from {summary['first'] or '-'} to {summary['last'] or '-'}",
+        "",
+        "Funnel:",
+        f"  evaluated {total}",
+    ]
+    for name in sorted(status, key=lambda s: -status[s]):
+        lines.append(f"  {name.lower():<9} {status[name]:>6}  {_percent(status[name], total)}")
+
+    if summary["reasons"]:
+        lines += ["", f"Top {top} skip/error reasons:"]
+        reasons = sorted(summary["reasons"].items(), key=lambda item: -item[1])[:top]
+        lines += [f"  {count:>6}  {reason}" for reason, count in reasons]
+
+    lines += ["", "Per city:", f"  {'city':<24}{'evaluated':>10}{'applied':>9}{'rate':>8}"]
+    for city, counts in sorted(summary["cities"].items(), key=lambda item: -item[1].get("Applied", 0)):
+        seen = sum(counts.values())
+        done = counts.get("Applied", 0)
+        lines.append(f"  {city[:23]:<24}{seen:>10}{done:>9}{_percent(done, seen):>8}")
+
+    recent = sorted(summary["weeks"])[-weeks:]
+    if recent:
+        cities = sorted({c for w in recent for c in summary["weeks"][w]})
+        lines += ["", f"Applications per week (last {len(recent)}):"]
+        lines.append(f"  {'week':<10}" + "".join(f"{c[:14]:>15}" for c in cities))
+        for week in recent:
+            counts = summary["weeks"][week]
+            lines.append(f"  {week:<10}" + "".join(f"{counts.get(c, 0):>15}" for c in cities))
+
+    if summary["distance"]:
+        lines += [""] + _histogram("Distance (miles)", summary["distance"], DISTANCE_BUCKETS, "miles")
+    if summary["wage"]:
+        lines += [""] + _histogram("Hourly wage", summary["wage"], WAGE_BUCKETS, "$/h")
+    if summary["seconds"]:
+        lines += ["", "Time per job (seconds):", f"  {'status':<9}{'jobs':>7}{'mean':>8}{'p50':>8}{'p90':>8}{'max':>8}"]
+        for name, stats in sorted(summary["seconds"].items()):
+            count = stats["count"]
+            lines.append(
+                f"  {name.lower():<9}{count:>7}{stats['total'] / count:>8.1f}"
+                f"{_approx_percentile(stats['hist'], count, 0.5):>8}"
+                f"{_approx_percentile(stats['hist'], count, 0.9):>8}{stats['max']:>8.1f}"
+            )
+    if applied and summary["first"] and summary["last"]:
+        span = (datetime.fromisoformat(summary["last"]) - datetime.fromisoformat(summary["first"])).days + 1
+        lines += ["", f"{applied} applications over {span} days ({applied / span:.1f} per day)"]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Report on the application log.")
+    parser.add_argument("--config", default="config.json", help="configuration file naming the log")
+    parser.add_argument("--log", help="log CSV to read (default: log_path from the config)")
+    parser.add_argument("--summary", default=SUMMARY_PATH, help="where the summary index is kept")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the saved summary and reread the log")
+    parser.add_argument("--weeks", type=int, default=8, help="weeks shown in the per-week table")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    log_path = args.log
+    if not log_path:
+        try:
+            with open(args.config, "r", encoding="utf-8") as f:
+                log_path = json.load(f).get("log_path")
+        except (OSError, ValueError):
+            pass
+    log_path = log_path or LOG_PATH
+    summary, added, replaced = update_summary(log_path, args.summary, args.rebuild)
+    if args.json:
+        print(json.dumps(summary, indent=2, sort_keys=True))
+        return
+    if replaced:
+        print(f"[{log_path} was replaced or truncated – rebuilt the summary]")
+    print(f"[Read {added} new rows from {log_path}]")
+    print(format_report(summary, args.weeks))
+
+
+if __name__ == "__main__":
+    main()
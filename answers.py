@@ -0,0 +1,260 @@
+"""User-maintained answers for Easy Apply screener questions.
+
+``answers.json`` (or ``answers.yaml`` when PyYAML is installed) maps
+questions to answers::
+
+    {
+      "answers": {
+        "how many years of customer service experience": "3",
+        "are you authorized to work in the united states": "Yes"
+      },
+      "fields": {"tel:phoneNumber": "401-555-1234"},
+      "defaults": {"text": "N/A", "tel": "555-555-5555"}
+    }
+
+Question keys are normalized (case, punctuation and "(optional)" ignored)
+and compiled into one lookup index; a key also matches any question that
+contains it. ``fields`` answers a specific input by its signature
+(``kind:name``). Once a named field is answered, the answer is remembered
+per employer in ``form_schemas.json`` so the same form is filled in one
+pass next time, without reading labels again. Fields without a name and
+jobs without a company always have their question read. That cache is
+dropped whenever
+the profile changes. Questions without an answer are collected in
+``unanswered_questions.json`` so they can be added to the profile later.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+
+log = logging.getLogger(__name__)
+
+ANSWERS_PATHS = ("answers.yaml", "answers.yml", "answers.json")
+FORM_SCHEMAS_PATH = "form_schemas.json"
+UNANSWERED_PATH = "unanswered_questions.json"
+
+DEFAULT_ANSWERS = {"text": "N/A", "tel": "555-555-5555"}
+
+_OPTIONAL = re.compile(r"\(optional\)|\*")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Return ``text`` lowercased with punctuation and markers removed."""
+    text = _OPTIONAL.sub(" ", (text or "").lower())
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def field_signature(kind: str, name: str) -> str:
+    return f"{kind}:{name}"
+
+
+def _read_json(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path: str, data: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+class AnswerProfile:
+    """Answer lookup backed by the user's profile and learned form schemas."""
+
+    def __init__(
+        self,
+        path: str | None = None,
+        schema_path: str = FORM_SCHEMAS_PATH,
+        unanswered_path: str = UNANSWERED_PATH,
+    ) -> None:
+        self.path = path or next((p for p in ANSWERS_PATHS if os.path.exists(p)), None)
+        self.schema_path = schema_path
+        self.unanswered_path = unanswered_path
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        raw = b""
+        data: dict = {}
+        if self.path and os.path.exists(self.path):
+            raw, data = self._load()
+        self.defaults = {**DEFAULT_ANSWERS, **data.get("defaults", {})}
+        self.fields: dict[str, str] = data.get("fields", {})
+        self._compile(data.get("answers", {}))
+
+        self.profile_hash = hashlib.sha1(raw).hexdigest()
+        schemas = _read_json(schema_path)
+        if schemas.get("profile_hash") != self.profile_hash:
+            # Learned answers may be stale once the user edits the profile
+            schemas = {"profile_hash": self.profile_hash, "employers": {}}
+        self.schemas = schemas
+        self.unanswered = _read_json(unanswered_path)
+
+    def _load(self) -> tuple[bytes, dict]:
+        """Return the profile's bytes and contents; empty if it can't be read."""
+        raw = b""
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            if self.path.endswith((".yaml", ".yml")):
+                try:
+                    # Imported here so runs without a YAML profile don't load it
+                    import yaml
+                except ImportError:  # pragma: no cover - optional dependency
+                    log.warning("PyYAML not installed – ignoring %s", self.path)
+                    return raw, {}
+                data = yaml.safe_load(raw)
+            else:
+                data = json.loads(raw or b"{}")
+        except Exception as exc:
+            log.warning("Could not read %s (%s) – using default answers", self.path, exc)
+            return raw, {}
+        if not isinstance(data, dict):
+            if data is not None:
+                log.warning("%s must contain a mapping – using default answers", self.path)
+            return raw, {}
+        return raw, data
+
+    def _compile(self, answers: dict) -> None:
+        """Build the exact-match table and one regex over all question keys."""
+        self._exact = {normalize(q): str(a) for q, a in answers.items() if normalize(q)}
+        keys = sorted(self._exact, key=len, reverse=True)
+        self._pattern = (
+            re.compile(r"\b(" + "|".join(re.escape(k) for k in keys) + r")\b") if keys else None
+        )
+
+    def lookup(self, question: str) -> str | None:
+        """Return the profile answer for ``question`` or ``None``."""
+        key = normalize(question)
+        if not key:
+            return None
+        if key in self._exact:
+            return self._exact[key]
+        if self._pattern:
+            match = self._pattern.search(key)
+            if match:
+                return self._exact[match.group(1)]
+        return None
+
+    def resolve(self, company: str, kind: str, name: str, question) -> str | None:
+        """Return the answer for one field, learning it for ``company``.
+
+        ``question`` is a callable returning the field's question text; it
+        is only called when the field is not already known, so repeat forms
+        skip the label lookup entirely. Fields without a ``name`` are told
+        apart by their question instead, and nothing is learned for them or
+        for an unnamed employer, whose answers would leak into other forms.
+        """
+        text = None
+        if not name:
+            text = question()
+            if not normalize(text):
+                return None
+        sig = field_signature(kind, name or "?" + normalize(text))
+        employer = normalize(company)
+        learn = bool(name and employer)
+        if learn:
+            with self._lock:
+                learned = self.schemas["employers"].get(employer, {}).get(sig)
+            if learned is not None:
+                return learned["answer"]
+        if sig in self.fields:
+            text, answer = "", str(self.fields[sig])
+        else:
+            text = question() if text is None else text
+            answer = self.lookup(text)
+        if answer is None:
+            self.record_unanswered(company, kind, sig, text)
+            return None
+        if not learn:
+            return answer
+        with self._lock:
+            self.schemas["employers"].setdefault(employer, {})[sig] = {
+                "question": text,
+                "answer": answer,
+            }
+            self._dirty = True
+        return answer
+
+    def default(self, kind: str) -> str:
+        return self.defaults.get(kind, self.defaults["text"])
+
+    def record_unanswered(self, company: str, kind: str, sig: str, question: str) -> None:
+        key = normalize(question) or sig
+        with self._lock:
+            entry = self.unanswered.setdefault(
+                key, {"question": question, "kind": kind, "signature": sig, "companies": [], "seen": 0}
+            )
+            entry["seen"] += 1
+            if company and company not in entry["companies"]:
+                entry["companies"].append(company)
+            self._dirty = True
+        if entry["seen"] == 1:
+            log.info("No saved answer for: %s – added to %s", question or sig, self.unanswered_path)
+
+    def save(self) -> None:
+        """Persist learned schemas and unanswered questions if they changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            _write_json(self.schema_path, self.schemas)
+            _write_json(self.unanswered_path, self.unanswered)
+            self._dirty = False
+
+
+def choose_option(options: list[tuple[str, object]], answer: str):
+    """Return the option whose label best matches ``answer``, if any."""
+    wanted = normalize(answer)
+    if not wanted:
+        return None
+    for label, option in options:
+        if normalize(label) == wanted:
+            return option
+    for label, option in options:
+        text = normalize(label)
+        if text and (text.startswith(wanted) or wanted.startswith(text)):
+            return option
+    return None
+
+
+_PROFILE: AnswerProfile | None = None
+
+
+def get_profile() -> AnswerProfile:
+    """Return the shared answer profile, loading it on first use."""
+    global _PROFILE
+    if _PROFILE is None:
+        _PROFILE = AnswerProfile()
+    return _PROFILE
+
+
+def field_question(driver, element) -> str:
+    """Return the question text shown for a form element."""
+    el_id = element.get_attribute("id")
+    if el_id:
+        labels = driver.find_elements("css selector", f"label[for='{el_id}']")
+        if labels and labels[0].text.strip():
+            return labels[0].text
+    return (
+        element.get_attribute("aria-label")
+        or element.get_attribute("placeholder")
+        or element.get_attribute("name")
+        or ""
+    )
+
+
+def group_question(driver, element) -> str:
+    """Return the question of the fieldset containing a radio button."""
+    legends = element.find_elements("xpath", "ancestor::fieldset[1]/legend")
+    if legends and legends[0].text.strip():
+        return legends[0].text
+    return field_question(driver, element)
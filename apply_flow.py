@@ -0,0 +1,157 @@
+"""Multi-step Easy Apply navigation shared by the Indeed bots.
+
+Easy Apply forms are split over several screens ("Continue", "Review",
+"Submit") rather than a single page. :func:`run_apply_flow` walks them as a
+small state machine: detect which kind of step is showing, fill it in,
+advance with the matching button and stop at the confirmation screen or
+after ``max_steps`` steps. The confirmation screen only counts once Submit
+has been clicked, so a job description that happens to thank the reader is
+never mistaken for a finished application.
+"""
+
+import logging
+import time
+from typing import Callable
+
+from bot_logging import log_context
+
+log = logging.getLogger(__name__)
+
+MAX_STEPS = 12
+# Seconds to wait for the next step to render after clicking a button
+STEP_WAIT = 10
+
+FORM = "form"
+REVIEW = "review"
+SUBMIT = "submit"
+UNKNOWN = "unknown"
+
+CONFIRMATION_XPATH = (
+    "//*[contains(text(),'application has been submitted') or contains(text(),'Application submitted')"
+    " or contains(text(),'Thank you for applying')]"
+)
+# Indeed moves to a post-apply page once an application is sent
+CONFIRMATION_URL_MARKERS = ("post-apply", "postapply")
+SUBMIT_XPATH = "//button[contains(., 'Submit')]"
+CONTINUE_XPATH = (
+    "//button[contains(., 'Continue') or contains(., 'Next') or contains(., 'Review')]"
+)
+REVIEW_XPATH = "//*[self::h1 or self::h2][contains(., 'review') or contains(., 'Review')]"
+
+
+def _visible(driver, xpath: str) -> list:
+    elements = []
+    for el in driver.find_elements("xpath", xpath):
+        try:
+            if el.is_displayed() and el.is_enabled():
+                elements.append(el)
+        except Exception:
+            continue
+    return elements
+
+
+def is_confirmed(driver) -> bool:
+    """Return True if the post-apply page or a visible confirmation shows."""
+    url = (driver.current_url or "").lower()
+    if any(marker in url for marker in CONFIRMATION_URL_MARKERS):
+        return True
+    return bool(_visible(driver, CONFIRMATION_XPATH))
+
+
+def detect_step(driver) -> tuple[str, object | None]:
+    """Return the kind of step on screen and the button that advances it."""
+    submit = _visible(driver, SUBMIT_XPATH)
+    if submit:
+        return SUBMIT, submit[0]
+    buttons = _visible(driver, CONTINUE_XPATH)
+    if buttons:
+        if driver.find_elements("xpath", REVIEW_XPATH):
+            return REVIEW, buttons[0]
+        return FORM, buttons[0]
+    return UNKNOWN, None
+
+
+def _signature(driver) -> tuple:
+    """Cheap fingerprint used to notice that a click moved to a new step."""
+    headings = driver.find_elements("xpath", "//h1 | //h2 | //legend")
+    text = headings[0].text if headings else ""
+    return driver.current_url, text, len(driver.find_elements("css selector", "input, select, textarea"))
+
+
+def _wait_for_change(driver, before: tuple, timeout: float, submitted: bool = False) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if _signature(driver) != before or (submitted and is_confirmed(driver)):
+                return True
+        except Exception:
+            # The DOM is being replaced under us; try again
+            pass
+        time.sleep(0.25)
+    return False
+
+
+def _upload_resume(driver, resume_path: str) -> bool:
+    inputs = driver.find_elements("css selector", "input[type='file']")
+    if not inputs or not resume_path:
+        return False
+    log.info("Uploading resume...")
+    inputs[0].send_keys(resume_path)
+    return True
+
+
+def run_apply_flow(
+    driver,
+    fill_fields: Callable[[object], None],
+    resume_path: str = "",
+    max_steps: int = MAX_STEPS,
+    step_wait: float = STEP_WAIT,
+    pause: Callable[[], None] | None = None,
+) -> str:
+    """Drive an opened Easy Apply form to completion.
+
+    Returns ``"Applied"`` once the confirmation screen shows, or ``"Error"``
+    when a step cannot be advanced or ``max_steps`` is reached.
+    """
+    with log_context(phase="apply"):
+        return _walk_steps(driver, fill_fields, resume_path, max_steps, step_wait, pause)
+
+
+def _walk_steps(driver, fill_fields, resume_path, max_steps, step_wait, pause) -> str:
+    uploaded = False
+    retried = False
+    submitted = False
+    for step in range(1, max_steps + 1):
+        if submitted and is_confirmed(driver):
+            return "Applied"
+        kind, button = detect_step(driver)
+        if kind == UNKNOWN:
+            # The next screen may still be rendering
+            before = _signature(driver)
+            if not _wait_for_change(driver, before, step_wait, submitted):
+                log.warning("Step %s: no Continue or Submit button found", step)
+                return "Error"
+            continue
+
+        log.debug("Step %s: %s", step, kind)
+        if not uploaded:
+            uploaded = _upload_resume(driver, resume_path)
+        fill_fields(driver)
+        if pause:
+            pause()
+        before = _signature(driver)
+        button.click()
+        submitted = submitted or kind == SUBMIT
+        if _wait_for_change(driver, before, step_wait, submitted):
+            retried = False
+            continue
+        if retried:
+            log.warning("Step %s: form did not advance – check required fields", step)
+            return "Error"
+        # Usually a validation error; fill again and retry once
+        retried = True
+        fill_fields(driver)
+    if submitted and is_confirmed(driver):
+        return "Applied"
+    log.warning("Gave up after %s steps", max_steps)
+    return "Error"
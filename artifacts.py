@@ -0,0 +1,253 @@
+"""Failure artifacts for diagnosing application errors.
+
+When an application fails, :meth:`ArtifactRecorder.capture` grabs a
+screenshot, a trimmed copy of the page DOM and the last WebDriver commands
+(recorded by :func:`attach_command_log`). Only the two browser calls happen
+on the caller's thread; decoding, compression and disk I/O are done by a
+background writer. Each failure becomes one zip file in
+``failure_artifacts/``, the oldest files are removed once the directory
+exceeds its size cap, and noisy failure reasons can be sampled. Settings
+come from the optional ``"artifacts"`` section of ``config.json``::
+
+    "artifacts": {
+      "enabled": true,
+      "directory": "failure_artifacts",
+      "max_mb": 200,
+      "max_dom_kb": 512,
+      "sample_rates": {"default": 1.0, "TimeoutException": 0.25}
+    }
+"""
+
+import base64
+import json
+import logging
+import math
+import os
+import queue
+import re
+import threading
+import time
+import traceback
+import zipfile
+from collections import deque
+from datetime import datetime
+
+log = logging.getLogger(__name__)
+
+ARTIFACTS_DIR = "failure_artifacts"
+ARTIFACTS_MAX_MB = 200
+# DOM snapshots are cut at this size after scripts and styles are removed
+MAX_DOM_KB = 512
+# Number of WebDriver commands kept for the command tail
+COMMAND_TAIL = 50
+# Failures waiting to be written; further ones are dropped, never waited on
+WRITE_QUEUE_SIZE = 8
+
+_MB = 1024 * 1024
+_PARAM_LIMIT = 120
+
+TRIMMED_DOM_JS = """
+const root = document.documentElement.cloneNode(true);
+root.querySelectorAll('script, style, noscript, svg, iframe, link[rel="stylesheet"]')
+    .forEach((el) => el.remove());
+return root.outerHTML.slice(0, arguments[0]);
+"""
+
+
+def _summarize(command: str, params: dict | None) -> dict:
+    """Return command parameters safe to store: short and without typed text."""
+    summary = {}
+    for key, value in (params or {}).items():
+        if command == "sendKeysToElement" and key in {"text", "value"}:
+            # Typed text may be personal data; keep only its length
+            value = f"<{len(''.join(value) if isinstance(value, list) else str(value))} chars>"
+        elif key == "script":
+            value = " ".join(str(value).split())
+        text = value if isinstance(value, (int, float, bool)) or value is None else str(value)
+        if isinstance(text, str) and len(text) > _PARAM_LIMIT:
+            text = text[:_PARAM_LIMIT] + "…"
+        summary[key] = text
+    return summary
+
+
+def attach_command_log(driver, size: int = COMMAND_TAIL):
+    """Record the last ``size`` WebDriver commands in ``driver.command_tail``.
+
+    Every Selenium command, including element calls, goes through
+    ``driver.execute``, which is wrapped here.
+    """
+    tail: deque = deque(maxlen=size)
+    execute = driver.execute
+
+    def logged_execute(command, params=None):
+        started = time.monotonic()
+        result = "ok"
+        try:
+            return execute(command, params)
+        except Exception as exc:
+            result = type(exc).__name__
+            raise
+        finally:
+            tail.append(
+                {
+                    "time": time.time(),
+                    "command": command,
+                    "params": _summarize(command, params),
+                    "seconds": round(time.monotonic() - started, 3),
+                    "result": result,
+                }
+            )
+
+    driver.execute = logged_execute
+    driver.command_tail = tail
+    return driver
+
+
+class ArtifactWriter(threading.Thread):
+    """Background thread that compresses failures into a capped ring buffer."""
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        super().__init__(name="artifact-writer", daemon=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._queue: queue.Queue = queue.Queue(WRITE_QUEUE_SIZE)
+        os.makedirs(directory, exist_ok=True)
+        self._files = deque(
+            sorted(
+                (entry.stat().st_mtime, entry.path, entry.stat().st_size)
+                for entry in os.scandir(directory)
+                if entry.name.endswith(".zip")
+            )
+        )
+        self._size = sum(size for _, _, size in self._files)
+
+    def submit(self, record: dict) -> bool:
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            return False
+
+    def stop(self) -> None:
+        """Write what is queued, then exit."""
+        self._queue.put(None)
+        self.join()
+
+    def run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            try:
+                self._write(record)
+            except Exception as exc:
+                log.warning("Could not save failure artifacts: %s", exc)
+
+    def _write(self, record: dict) -> None:
+        stamp = datetime.fromtimestamp(record["meta"]["time"]).strftime("%Y%m%d-%H%M%S-%f")
+        name = re.sub(r"[^\w.-]+", "_", f"{stamp}-{record['meta']['reason']}-{record['meta'].get('job_id', '')}")
+        path = os.path.join(self.directory, name + ".zip")
+        tmp = path + ".tmp"
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("meta.json", json.dumps(record["meta"], indent=2, default=str))
+            archive.writestr("commands.json", json.dumps(record["commands"], indent=2, default=str))
+            if record.get("dom"):
+                archive.writestr("dom.html", record["dom"])
+            if record.get("screenshot"):
+                # PNG data is already compressed
+                archive.writestr(
+                    "screenshot.png", base64.b64decode(record["screenshot"]), zipfile.ZIP_STORED
+                )
+        os.replace(tmp, path)
+        size = os.path.getsize(path)
+        self._files.append((time.time(), path, size))
+        self._size += size
+        log.info("Saved failure artifacts to %s", path)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete the oldest archives until the directory fits its cap."""
+        while self._size > self.max_bytes and len(self._files) > 1:
+            _, path, size = self._files.popleft()
+            self._size -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class ArtifactRecorder:
+    """Capture failure artifacts according to the ``"artifacts"`` config."""
+
+    def __init__(self, cfg: dict | None = None) -> None:
+        settings = (cfg or {}).get("artifacts", {})
+        self.enabled = settings.get("enabled", True)
+        self.directory = settings.get("directory", ARTIFACTS_DIR)
+        self.max_bytes = int(settings.get("max_mb", ARTIFACTS_MAX_MB) * _MB)
+        self.max_dom_chars = int(settings.get("max_dom_kb", MAX_DOM_KB) * 1024)
+        self.sample_rates: dict[str, float] = {"default": 1.0, **settings.get("sample_rates", {})}
+        self._seen: dict[str, int] = {}
+        self._writer: ArtifactWriter | None = None
+
+    def should_capture(self, reason: str) -> bool:
+        """Sample failures per reason; the first of each reason is always kept.
+
+        With a rate of 0.25 the 1st, 5th, 9th… failures are captured.
+        """
+        rate = self.sample_rates.get(reason, self.sample_rates["default"])
+        if rate <= 0:
+            return False
+        count = self._seen.get(reason, 0) + 1
+        self._seen[reason] = count
+        return math.ceil(count * rate) > math.ceil((count - 1) * rate)
+
+    def capture(self, driver, reason: str, job: dict | None = None, exc: BaseException | None = None) -> None:
+        """Grab the page state for a failure and queue it for writing."""
+        if not self.enabled or not self.should_capture(reason):
+            return
+        # Copy the tail first so the capture's own commands aren't in it
+        commands = list(getattr(driver, "command_tail", ()))
+        meta = {
+            "time": time.time(),
+            "reason": reason,
+            "job_id": (job or {}).get("id", ""),
+            "job": job or {},
+            "error": "".join(traceback.format_exception(exc)) if exc else None,
+        }
+        record = {"meta": meta, "commands": commands}
+        try:
+            meta["url"] = driver.current_url
+            record["screenshot"] = driver.get_screenshot_as_base64()
+            record["dom"] = driver.execute_script(TRIMMED_DOM_JS, self.max_dom_chars)
+        except Exception as capture_exc:
+            # A dead session still leaves the command tail and error to save
+            meta["capture_error"] = str(capture_exc)
+        if self._writer is None:
+            self._writer = ArtifactWriter(self.directory, self.max_bytes)
+            self._writer.start()
+        if not self._writer.submit(record):
+            log.debug("Artifact writer busy – dropped artifacts for %s", reason)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+
+
+_RECORDER: ArtifactRecorder | None = None
+
+
+def get_recorder(cfg: dict | None = None) -> ArtifactRecorder:
+    """Return the shared recorder, creating it from ``cfg`` on first use."""
+    global _RECORDER
+    if _RECORDER is None:
+        _RECORDER = ArtifactRecorder(cfg)
+    return _RECORDER
+
+
+def close_recorder() -> None:
+    """Flush pending artifacts and stop the writer thread."""
+    global _RECORDER
+    if _RECORDER is not None:
+        _RECORDER.close()
+        _RECORDER = None
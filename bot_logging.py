@@ -0,0 +1,134 @@
+"""Structured logging for the Indeed bots.
+
+Log calls only put a record on a queue; a :class:`~logging.handlers.QueueListener`
+thread formats and writes it, so a slow console never holds up the browser.
+Every record carries the job context (job id, city and phase) set with
+:func:`log_context`. The console shows the familiar ``[message]`` lines, or
+one JSON object per line with ``--log-json``; ``--log-file`` additionally
+writes JSON lines to a file and ``--quiet`` limits the console to warnings.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime, timezone
+
+CONTEXT_FIELDS = ("job_id", "city", "phase")
+# Third-party loggers that are far too chatty below WARNING
+NOISY_LOGGERS = ("selenium", "urllib3", "geopy", "asyncio")
+
+_CONTEXT: contextvars.ContextVar[dict] = contextvars.ContextVar("log_context", default={})
+_QUEUE: queue.Queue | None = None
+_LISTENER: logging.handlers.QueueListener | None = None
+
+
+@contextlib.contextmanager
+def log_context(**fields):
+    """Attach ``fields`` (e.g. ``job_id``, ``city``, ``phase``) to records logged inside."""
+    token = _CONTEXT.set({**_CONTEXT.get(), **fields})
+    try:
+        yield
+    finally:
+        _CONTEXT.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the current job context onto each record in the logging thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _CONTEXT.get()
+        for name in CONTEXT_FIELDS:
+            if not hasattr(record, name):
+                setattr(record, name, context.get(name))
+        return True
+
+
+class ConsoleFormatter(logging.Formatter):
+    """``[message]`` lines, with the level shown for warnings and errors."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.levelno >= logging.WARNING:
+            return f"[{record.levelname}: {message}]"
+        return f"[{message}]"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(
+    level: str = "INFO",
+    json_output: bool = False,
+    quiet: bool = False,
+    log_file: str | None = None,
+) -> None:
+    """Route all logging through a queue to the console and optional file."""
+    global _QUEUE, _LISTENER
+    stop_logging()
+    level_no = logging.getLevelName(level.upper())
+    if not isinstance(level_no, int):
+        raise SystemExit(f"[Unknown log level: {level}]")
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(JsonFormatter() if json_output else ConsoleFormatter())
+    console.setLevel(max(level_no, logging.WARNING) if quiet else level_no)
+    handlers: list[logging.Handler] = [console]
+    if log_file:
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(JsonFormatter())
+        file_handler.setLevel(level_no)
+        handlers.append(file_handler)
+
+    _QUEUE = queue.Queue()
+    queue_handler = logging.handlers.QueueHandler(_QUEUE)
+    # Runs in the calling thread, where the context variables are set
+    queue_handler.addFilter(ContextFilter())
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(min(h.level for h in handlers))
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    _LISTENER = logging.handlers.QueueListener(_QUEUE, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+
+
+def flush_logs() -> None:
+    """Wait until every queued record is written, e.g. before prompting."""
+    if _QUEUE is not None:
+        _QUEUE.join()
+    sys.stdout.flush()
+
+
+def stop_logging() -> None:
+    """Write the remaining records and stop the listener thread."""
+    global _LISTENER
+    if _LISTENER is None:
+        return
+    _LISTENER.stop()
+    for handler in _LISTENER.handlers:
+        handler.close()
+    _LISTENER = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,152 @@
+"""Crash-safe run checkpoints for the Indeed bots.
+
+A checkpoint records where a run is: the current city, how many times the
+results page was scrolled for more cards, the applications counted toward
+``max_applications``, the harvested jobs still waiting to be evaluated and
+the IDs already evaluated this run. It is rewritten atomically after every
+change so a crash, a dead WebDriver session or a sleeping machine costs at
+most the job that was in progress.
+"""
+
+import json
+import logging
+import os
+import time
+
+log = logging.getLogger(__name__)
+
+CHECKPOINT_PATH = "run_checkpoint.json"
+# Consecutive driver restarts without finishing a job before giving up
+MAX_RECOVERIES = 3
+
+_DEAD_SESSION_MARKERS = (
+    "invalid session id",
+    "chrome not reachable",
+    "disconnected",
+    "session deleted",
+    "no such window",
+    "tab crashed",
+)
+
+
+class Checkpoint:
+    """Mutable run state persisted to ``path`` on every update."""
+
+    def __init__(self, locations: list[str], path: str = CHECKPOINT_PATH) -> None:
+        self.path = path
+        self.locations = list(locations)
+        self.city_index = 0
+        self.page = 0
+        self.count = 0
+        self.pending: list[dict] = []
+        self.processed: set[str] = set()
+        self.started_at = time.time()
+
+    @classmethod
+    def load(cls, locations: list[str], path: str = CHECKPOINT_PATH) -> "Checkpoint | None":
+        """Return the saved checkpoint for ``locations`` or ``None``."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            log.warning("Checkpoint unreadable – starting a new run")
+            return None
+        if data.get("locations") != list(locations):
+            log.warning("Checkpoint was made for different locations – starting a new run")
+            return None
+        state = cls(locations, path)
+        state.city_index = data.get("city_index", 0)
+        state.page = data.get("page", 0)
+        state.count = data.get("count", 0)
+        state.pending = data.get("pending", [])
+        state.processed = set(data.get("processed", []))
+        state.started_at = data.get("started_at", state.started_at)
+        return state
+
+    @property
+    def city(self) -> str | None:
+        if self.city_index < len(self.locations):
+            return self.locations[self.city_index]
+        return None
+
+    def save(self) -> None:
+        """Atomically write the checkpoint, flushing it to disk."""
+        data = {
+            "locations": self.locations,
+            "city_index": self.city_index,
+            "city": self.city,
+            "page": self.page,
+            "count": self.count,
+            "pending": self.pending,
+            "processed": sorted(self.processed),
+            "started_at": self.started_at,
+            "updated_at": time.time(),
+        }
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def queue_jobs(self, jobs: list[dict]) -> None:
+        self.pending = list(jobs)
+        self.save()
+
+    def finish_job(self, job: dict, status: str) -> None:
+        """Record the outcome of the job at the head of the queue."""
+        self.pending = [j for j in self.pending if j["id"] != job["id"]]
+        self.processed.add(job["id"])
+        if status == "Applied":
+            self.count += 1
+        self.save()
+
+    def next_page(self) -> None:
+        self.page += 1
+        self.save()
+
+    def next_city(self) -> None:
+        self.city_index += 1
+        self.page = 0
+        self.pending = []
+        self.save()
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the run has finished."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def start_or_resume(locations: list[str], resume: bool, path: str = CHECKPOINT_PATH) -> Checkpoint:
+    """Return the saved checkpoint when resuming, otherwise a fresh one."""
+    state = Checkpoint.load(locations, path) if resume else None
+    if state is None:
+        if resume:
+            log.info("No checkpoint to resume – starting a new run")
+        state = Checkpoint(locations, path)
+        state.save()
+    else:
+        log.info(
+            "Resuming at %s (page %s) with %s applications and %s queued jobs",
+            state.city,
+            state.page,
+            state.count,
+            len(state.pending),
+        )
+    return state
+
+
+def is_session_dead(exc: BaseException) -> bool:
+    """Return True if ``exc`` means the WebDriver session is gone."""
+    if isinstance(exc, ConnectionError):
+        # chromedriver itself is no longer listening
+        return True
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    if names & {"InvalidSessionIdException", "MaxRetryError", "NewConnectionError"}:
+        return True
+    if "WebDriverException" in names:
+        message = str(exc).lower()
+        return any(marker in message for marker in _DEAD_SESSION_MARKERS)
+    return False
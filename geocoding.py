@@ -0,0 +1,183 @@
+"""Cached, rate-limited geocoding shared by the Indeed bots.
+
+Nominatim's usage policy allows at most one request per second, so every
+lookup — foreground or background — goes through a single limiter. Results
+(including misses) are kept in an on-disk cache, and a background
+prefetcher resolves locations from harvested job cards while the browser is
+busy so ``calculate_distance()`` rarely has to wait on the network.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Iterable
+
+log = logging.getLogger(__name__)
+
+GEOCODE_CACHE_PATH = "geocode_cache.json"
+# Minimum seconds between requests to Nominatim
+GEOCODE_MIN_INTERVAL = 1.0
+
+_GEOLOCATOR = None
+
+
+def get_geolocator():
+    """Return the Nominatim client, importing geopy on first use."""
+    global _GEOLOCATOR
+    if _GEOLOCATOR is None:
+        from geopy.geocoders import Nominatim
+
+        _GEOLOCATOR = Nominatim(user_agent="indeed-bot")
+    return _GEOLOCATOR
+
+
+class RateLimiter:
+    """Thread-safe limiter enforcing a minimum interval between calls."""
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._last + self.min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._last = time.monotonic()
+
+
+class GeocodeCache:
+    """Thread-safe address → ``(lat, lon)`` cache persisted as JSON.
+
+    Addresses that could not be resolved are stored as ``None`` so they are
+    not looked up again.
+    """
+
+    def __init__(self, path: str = GEOCODE_CACHE_PATH) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: dict[str, list[float] | None] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                log.warning("Geocode cache unreadable – starting empty")
+
+    @staticmethod
+    def key(address: str) -> str:
+        return " ".join(address.lower().split())
+
+    def __contains__(self, address: str) -> bool:
+        with self._lock:
+            return self.key(address) in self._data
+
+    def get(self, address: str) -> tuple[float, float] | None:
+        with self._lock:
+            value = self._data.get(self.key(address))
+        return tuple(value) if value else None
+
+    def put(self, address: str, coords: tuple[float, float] | None) -> None:
+        with self._lock:
+            self._data[self.key(address)] = list(coords) if coords else None
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f)
+            os.replace(tmp, self.path)
+
+
+LIMITER = RateLimiter(GEOCODE_MIN_INTERVAL)
+CACHE = GeocodeCache()
+
+
+def _lookup(address: str) -> tuple[float, float] | None:
+    """Query Nominatim under the shared limiter and cache the answer."""
+    LIMITER.wait()
+    try:
+        loc = get_geolocator().geocode(address)
+    except Exception as exc:  # pragma: no cover - network issues
+        # Transient failures are not cached so a later call can retry
+        log.warning("Geocoding error: %s", exc)
+        return None
+    coords = (loc.latitude, loc.longitude) if loc else None
+    CACHE.put(address, coords)
+    return coords
+
+
+def geocode(address: str):
+    """Return (lat, lon) for an address if possible."""
+    if not address:
+        return None
+    if address in CACHE:
+        return CACHE.get(address)
+    return _lookup(address)
+
+
+def calculate_distance(addr1: str, addr2: str) -> float | None:
+    """Return distance in miles between two addresses."""
+    from geopy.distance import geodesic
+
+    loc1 = geocode(addr1)
+    loc2 = geocode(addr2)
+    if not loc1 or not loc2:
+        return None
+    return round(geodesic(loc1, loc2).miles, 1)
+
+
+class GeocodePrefetcher(threading.Thread):
+    """Background worker that resolves queued addresses into the cache."""
+
+    def __init__(self) -> None:
+        super().__init__(name="geocode-prefetcher", daemon=True)
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._queued: set[str] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, addresses: Iterable[str]) -> None:
+        for address in addresses:
+            if not address or address in CACHE:
+                continue
+            key = GeocodeCache.key(address)
+            with self._lock:
+                if key in self._queued:
+                    continue
+                self._queued.add(key)
+            self._queue.put(address)
+
+    def stop(self) -> None:
+        self._queue.put(None)
+
+    def run(self) -> None:
+        while True:
+            address = self._queue.get()
+            if address is None:
+                return
+            # The foreground may have resolved it while it was queued
+            if address not in CACHE:
+                _lookup(address)
+            with self._lock:
+                self._queued.discard(GeocodeCache.key(address))
+
+
+_PREFETCHER: GeocodePrefetcher | None = None
+
+
+def prefetch_locations(addresses: Iterable[str]) -> None:
+    """Queue addresses for background geocoding, starting the worker if needed."""
+    global _PREFETCHER
+    if _PREFETCHER is None:
+        _PREFETCHER = GeocodePrefetcher()
+        _PREFETCHER.start()
+    _PREFETCHER.submit(addresses)
+
+
+def stop_prefetcher() -> None:
+    """Ask the background worker to exit after its current lookup."""
+    global _PREFETCHER
+    if _PREFETCHER is not None:
+        _PREFETCHER.stop()
+        _PREFETCHER = None
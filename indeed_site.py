@@ -0,0 +1,579 @@
+"""Indeed automation shared by ``indeed_bot.py`` and ``indeed_easy_apply.py``.
+
+Config handling, the Chrome session, searching, harvesting result cards,
+evaluating and applying to a job and the ``--scan-details`` snapshot all
+live here. :func:`bot_spec` wires them into a :class:`~pipeline.BotSpec`;
+an entry point only overrides what differs, such as human-like pauses,
+cookie reuse or an API fallback.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Callable
+
+from answers import choose_option, field_question, get_profile, group_question
+from apply_flow import MAX_STEPS, run_apply_flow
+from artifacts import attach_command_log, get_recorder
+from bot_logging import flush_logs
+from geocoding import calculate_distance
+from job_log import LOG_PATH, save_log
+from pipeline import BotSpec
+from salary import hourly_wage
+from session_state import is_logged_in
+from startup import StartupTimer, build_search_url
+
+try:
+    from win10toast import ToastNotifier
+except ImportError:  # pragma: no cover - optional dependency
+    ToastNotifier = None
+
+log = logging.getLogger(__name__)
+
+CONFIG_PATH = "config.json"
+APPLIED_JOBS_PATH = "applied_jobs.txt"
+WAIT_TIME = 20
+LOGIN_CHECK_WAIT = 120
+# Path to the bots' dedicated Chrome user data directory
+USER_DATA_DIR = "C:/Users/Jesse/AppData/Local/Google/Chrome/BotProfile"
+
+
+# Selenium is imported by load_selenium() on first use so argument and
+# config handling don't wait for it. Every function that needs these names
+# takes a driver, which only exists once load_selenium() has run.
+webdriver = None
+SessionNotCreatedException = None
+By = None
+Keys = None
+EC = None
+WebDriverWait = None
+
+
+def load_selenium() -> None:
+    """Import Selenium into the module namespace if not done yet."""
+    global webdriver, SessionNotCreatedException, By, Keys, EC, WebDriverWait
+    if webdriver is not None:
+        return
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+
+def _no_pause() -> None:
+    pass
+
+
+# Configuration -------------------------------------------------------
+
+
+def save_config(cfg: dict, path: str = CONFIG_PATH) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cfg, f, indent=2)
+
+
+def prompt_for_config() -> dict:
+    flush_logs()
+    print("[Config setup]")
+    cfg = {
+        "resume_path": input("Path to resume PDF: ").strip(),
+        "min_salary": float(input("Minimum hourly wage (e.g. 17): ").strip() or "17"),
+        "locations": [loc.strip() for loc in input("Locations (comma separated): ").split(",") if loc.strip()],
+        "user_address": input("Your home address: ").strip(),
+
+        "max_applications": int(input("Maximum applications: ").strip() or "50"),
+        "log_path": input("Log CSV path: ").strip() or LOG_PATH,
+    }
+    return cfg
+
+
+def load_config(path: str = CONFIG_PATH, interactive: bool = True) -> dict:
+    """Load configuration or interactively prompt on first run.
+
+    With ``interactive=False`` an existing file is used as-is, and a missing
+    one is an error instead of a prompt.
+    """
+    if not os.path.exists(path):
+        if not interactive:
+            raise SystemExit(f"[Config file {path} not found – run once interactively to create it]")
+        cfg = prompt_for_config()
+        save_config(cfg, path)
+        return cfg
+    with open(path, "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+    if not interactive:
+        return cfg
+    flush_logs()
+    choice = input("Use existing configuration? (Y/n): ").strip().lower()
+    if choice == "n":
+        cfg = prompt_for_config()
+        save_config(cfg, path)
+    return cfg
+
+
+def load_applied_jobs(path: str = APPLIED_JOBS_PATH) -> set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        return set(line.strip() for line in f if line.strip())
+
+
+def save_applied_job(job_id: str, path: str = APPLIED_JOBS_PATH) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(job_id + "\n")
+
+
+# Browser session -----------------------------------------------------
+
+
+def setup_driver(
+    start_url: str = "https://www.indeed.com",
+    chrome_args: tuple[str, ...] = (),
+    before_start: Callable[[webdriver.Chrome], None] | None = None,
+) -> webdriver.Chrome:
+    """Create a Chrome WebDriver using a dedicated user profile.
+
+    ``chrome_args`` are added to the common options, and ``before_start``
+    runs before the first navigation (e.g. to inject saved cookies). The
+    browser opens ``start_url``; fast-start runs pass the first search
+    results page so the home page is never loaded.
+    """
+    load_selenium()
+    options = webdriver.ChromeOptions()
+    options.add_argument(f"--user-data-dir={USER_DATA_DIR}")
+    # Avoid reusing the default profile to prevent conflicts
+    options.add_argument("--start-maximized")
+    for arg in chrome_args:
+        options.add_argument(arg)
+    try:
+        driver = webdriver.Chrome(options=options)
+    except SessionNotCreatedException:
+        log.error("Chrome session couldn’t be created—check ChromeDriver/Chrome versions or profile path")
+        raise
+    attach_command_log(driver)
+    if before_start:
+        before_start(driver)
+    log.info("Launched Chrome and navigating to %s...", start_url)
+    driver.get(start_url)
+    return driver
+
+
+def ensure_logged_in(driver: webdriver.Chrome, pause: Callable[[], None] = _no_pause) -> None:
+    """Detect login state and wait for manual login if needed."""
+    if is_logged_in(driver):
+        log.info("Already logged in – proceeding to search")
+        return
+    log.warning("Not logged in – please log in manually")
+    try:
+        WebDriverWait(driver, LOGIN_CHECK_WAIT).until(is_logged_in)
+        pause()
+        log.info("Login detected – continuing bot")
+    except Exception:
+        log.warning("Login not detected – continuing anyway")
+
+
+def start_session(
+    start_url: str, args, timer: StartupTimer, chrome_args: tuple[str, ...] = ()
+) -> webdriver.Chrome:
+    """Launch Chrome and make sure we are signed in."""
+    load_selenium()
+    timer.mark("selenium import")
+    driver = setup_driver(start_url, chrome_args)
+    timer.mark("chrome")
+    ensure_logged_in(driver)
+    timer.mark("login")
+    return driver
+
+
+def restart_driver(
+    driver: webdriver.Chrome,
+    reason: str = "WebDriver session lost",
+    start: Callable[[], webdriver.Chrome] = setup_driver,
+    pause: Callable[[], None] = _no_pause,
+) -> webdriver.Chrome:
+    """Replace a dead or bloated WebDriver session with a fresh, logged-in one.
+
+    ``start`` launches the new browser.
+    """
+    log.warning("%s – restarting Chrome", reason)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    driver = start()
+    ensure_logged_in(driver, pause)
+    return driver
+
+
+# Search and harvest --------------------------------------------------
+
+
+def search_jobs_for_city(
+    driver: webdriver.Chrome, city: str, fast: bool = False, pause: Callable[[], None] = _no_pause
+) -> None:
+    """Search Indeed for any jobs in a specific city.
+
+    With ``fast`` the results URL is opened directly instead of typing the
+    city into the home page search form.
+    """
+    log.info("Searching in %s", city)
+    wait = WebDriverWait(driver, WAIT_TIME)
+    if fast:
+        url = build_search_url(city)
+        # setup_driver() may already have opened this page
+        if driver.current_url != url:
+            driver.get(url)
+    else:
+        driver.get("https://www.indeed.com")
+        pause()
+        what = wait.until(EC.element_to_be_clickable((By.ID, "text-input-what")))
+        where = driver.find_element(By.ID, "text-input-where")
+        what.clear()
+        # leave keywords blank for a broad search
+        where.clear()
+        pause()
+        where.send_keys(city)
+        pause()
+        where.send_keys(Keys.RETURN)
+    wait.until(EC.presence_of_element_located((By.ID, "resultsCol")))
+
+
+def search_city(
+    driver: webdriver.Chrome, city: str, cfg: dict, seen: set[str], fast: bool
+) -> list[dict] | None:
+    search_jobs_for_city(driver, city, fast)
+    return None
+
+
+def get_easy_apply_jobs(driver: webdriver.Chrome, seen: set[str], cfg: dict) -> list[dict]:
+
+    jobs: list[dict] = []
+    elements = driver.find_elements(
+        By.XPATH, "//span[contains(text(),'Easily apply')]/ancestor::a[@data-jk]"
+    )
+    for el in elements:
+        jid = el.get_attribute("data-jk")
+        if not jid:
+            continue
+        if jid in seen:
+            log.debug("Skipping previously applied job: %s", jid)
+            continue
+        try:
+            company = el.find_element(By.CSS_SELECTOR, ".companyName").text
+        except Exception:
+            company = ""
+        try:
+            loc = el.find_element(By.CSS_SELECTOR, ".companyLocation").text
+        except Exception:
+            loc = ""
+        text = el.text.strip()
+        jobs.append(
+            {
+                "id": jid,
+                "link": el.get_attribute("href"),
+                "title": text.split("\n")[0],
+                "company": company,
+                "location": loc,
+                # Full card text, screened by --scan for salary and job type
+                "snippet": text,
+            }
+        )
+    return jobs
+
+
+# Job page ------------------------------------------------------------
+
+
+def is_valid_job_type(page_text: str) -> bool:
+    text = page_text.lower()
+    if any(word in text for word in ["contract", "temporary", "internship"]):
+        return False
+    return "full-time" in text or "part-time" in text
+
+
+def meets_salary_requirement(text: str, minimum: float) -> bool:
+    """Return True if the pay, as an hourly wage, reaches ``minimum``.
+
+    Uses the same conversion as ``--scan``, so a yearly salary is compared
+    per hour rather than as a raw dollar amount.
+    """
+    wage = hourly_wage(text)
+    return wage is not None and wage >= minimum
+
+
+def extract_salary(driver: webdriver.Chrome) -> str | None:
+
+    try:
+        el = driver.find_element(By.CSS_SELECTOR, ".salary-snippet")
+        return el.text
+    except Exception:
+        return None
+
+
+def extract_job_type(driver: webdriver.Chrome) -> str | None:
+
+    """Return the job type text if available."""
+    try:
+        key = driver.find_element(
+            By.XPATH,
+            "//*[contains(text(),'Job Type') or contains(text(),'Job type')]/following-sibling::*",
+        )
+        return key.text
+    except Exception:
+        # fallback to scanning page text
+        page = driver.page_source.lower()
+        for word in ["full-time", "part-time", "contract", "temporary", "internship"]:
+            if word in page:
+                return word
+        return None
+
+
+def extract_location(driver: webdriver.Chrome) -> str | None:
+
+    """Return job location text if possible."""
+    selectors = [
+        ".jobsearch-JobInfoHeader-subtitle div",
+        ".jobsearch-DesktopStickyContainer-subtitle div",
+        ".companyLocation",
+    ]
+    for sel in selectors:
+        try:
+            loc = driver.find_element(By.CSS_SELECTOR, sel).text
+            if loc:
+                return loc
+        except Exception:
+            continue
+    return None
+
+
+def fill_additional_fields(driver: webdriver.Chrome, company: str = "") -> None:
+
+    """Handle common form fields during applications.
+
+    Answers come from the user's answer profile (see ``answers.py``); fields
+    it doesn't cover fall back to neutral defaults and are logged.
+    """
+    profile = get_profile()
+    # Text inputs and textareas
+    fields = driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='tel'], textarea, input:not([type])")
+    for field in fields:
+        try:
+            if not field.is_displayed() or not field.is_enabled() or field.get_attribute("value"):
+                continue
+            kind = "tel" if field.get_attribute("type") == "tel" else "text"
+            name = field.get_attribute("name") or field.get_attribute("id") or ""
+            answer = profile.resolve(company, kind, name, lambda: field_question(driver, field))
+            log.debug("Filling input: %s", name or "input")
+            field.clear()
+            field.send_keys(answer if answer is not None else profile.default(kind))
+        except Exception:
+            log.debug("Unknown form element skipped")
+
+    # Dropdowns
+    selects = driver.find_elements(By.TAG_NAME, "select")
+    for select in selects:
+        try:
+            if not select.is_displayed() or not select.is_enabled():
+                continue
+            label = select.get_attribute("name") or select.get_attribute("id") or ""
+            options = [
+                option
+                for option in select.find_elements(By.TAG_NAME, "option")
+                if option.get_attribute("value") and not option.get_attribute("disabled")
+            ]
+            if not options:
+                continue
+            answer = profile.resolve(company, "select", label, lambda: field_question(driver, select))
+            choice = choose_option([(o.text, o) for o in options], answer) if answer else None
+            log.debug("Selecting from dropdown: %s", label or "dropdown")
+            (choice or options[0]).click()
+        except Exception:
+            log.debug("Unknown form element skipped")
+
+    # Radio buttons
+    radios = driver.find_elements(By.CSS_SELECTOR, "input[type='radio']")
+    grouped: dict[str, list] = {}
+    for radio in radios:
+        if not radio.is_displayed() or not radio.is_enabled():
+            continue
+        grouped.setdefault(radio.get_attribute("name"), []).append(radio)
+    for name, group in grouped.items():
+        try:
+            answer = profile.resolve(company, "radio", name or "", lambda: group_question(driver, group[0]))
+            choice = None
+            if answer:
+                choice = choose_option([(field_question(driver, r), r) for r in group], answer)
+            if not choice:
+                for r in group:
+                    lab = (r.get_attribute("aria-label") or "").lower()
+                    if "yes" in lab:
+                        choice = r
+                        break
+            if not choice:
+                choice = group[0]
+            log.debug("Selecting radio option: %s", name or "radio")
+            choice.click()
+        except Exception:
+            log.debug("Unknown form element skipped")
+
+    # Required checkboxes
+    checkboxes = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+    for box in checkboxes:
+        try:
+            if not box.is_displayed() or not box.is_enabled() or box.is_selected():
+                continue
+            if box.get_attribute("required") or box.get_attribute("aria-required"):
+                label = box.get_attribute("aria-label") or box.get_attribute("name") or "checkbox"
+                log.debug("Checking checkbox: %s", label)
+                box.click()
+        except Exception:
+            log.debug("Unknown form element skipped")
+    profile.save()
+
+
+def apply_to_job(
+    driver: webdriver.Chrome,
+    job: dict,
+    city: str,
+    cfg: dict,
+    pause: Callable[[], None] = _no_pause,
+    on_open: Callable[[webdriver.Chrome], None] | None = None,
+) -> tuple[str, float | None]:
+    """Attempt to apply to a job and return (status, distance).
+
+    ``pause`` runs between browser actions and ``on_open`` once the job's
+    tab is showing.
+    """
+    link = job["link"]
+    log.info("Evaluating: %s at %s", job["title"], job["company"])
+    driver.execute_script("window.open(arguments[0], '_blank');", link)
+    pause()
+    driver.switch_to.window(driver.window_handles[-1])
+    if on_open:
+        on_open(driver)
+    wait = WebDriverWait(driver, WAIT_TIME)
+    status = "Skipped"
+    distance = None
+
+    try:
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        job_type = extract_job_type(driver)
+        if job_type is None or job_type.lower() not in {"full-time", "part-time"}:
+            skip_type = job_type if job_type else "Unknown"
+            log.info("Skipping job - type is %s", skip_type)
+            job["reason"] = f"job type is {skip_type.lower()}"
+            return status, distance
+        salary_text = extract_salary(driver)
+        if not salary_text:
+            log.info("Skipping job - salary not listed")
+            job["reason"] = "salary not listed"
+            return status, distance
+        job["salary"] = salary_text
+        if not meets_salary_requirement(salary_text, cfg["min_salary"]):
+            log.info("Skipping job - salary too low")
+            job["reason"] = "salary too low"
+            return status, distance
+        job_location = extract_location(driver) or job["location"]
+        if job_location == job["location"] and job.get("distance") is not None:
+            # Already computed by the pipeline's enrich stage
+            distance = job["distance"]
+        elif job_location:
+            distance = calculate_distance(cfg.get("user_address", ""), job_location)
+        if job_location:
+            if distance is not None:
+                log.info("Distance to job: %s miles", distance)
+
+        log.info("Criteria met - applying now")
+        apply_button = wait.until(
+            EC.element_to_be_clickable(
+                (By.XPATH, "//button[contains(., 'Apply') or contains(., 'Submit')]")
+            )
+        )
+        pause()
+        apply_button.click()
+        pause()
+        # Walk the Continue/Review/Submit steps until the confirmation screen
+        status = run_apply_flow(
+            driver,
+            lambda d: fill_additional_fields(d, job["company"]),
+            cfg["resume_path"],
+            max_steps=cfg.get("max_apply_steps", MAX_STEPS),
+            pause=pause,
+        )
+        if status == "Applied":
+            dist_msg = f" ({distance} miles)" if distance is not None else ""
+            if ToastNotifier:
+                ToastNotifier().show_toast(
+                    "Indeed Bot: Application Sent",
+                    f"{job['title']} at {job['company']} - {distance} mi away" if distance is not None else f"{job['title']} at {job['company']}",
+                    duration=5,
+                    threaded=True,
+                )
+            log.info("Application sent: %s at %s%s", job["title"], job["company"], dist_msg)
+
+            log.info("Application complete")
+        elif status == "Error":
+            job["reason"] = "apply flow"
+            get_recorder(cfg).capture(driver, "apply_flow", job)
+    except Exception as exc:
+        status = "Error"
+        log.error("Error: %s", exc)
+        job["reason"] = type(exc).__name__
+        get_recorder(cfg).capture(driver, type(exc).__name__, job, exc)
+    finally:
+        driver.close()
+        driver.switch_to.window(driver.window_handles[0])
+    return status, distance
+
+
+def snapshot_job(driver: webdriver.Chrome, job: dict, pause: Callable[[], None] = _no_pause) -> dict:
+    """Read a job's salary, type and location from its page without applying."""
+    driver.execute_script("window.open(arguments[0], '_blank');", job["link"])
+    pause()
+    driver.switch_to.window(driver.window_handles[-1])
+    try:
+        WebDriverWait(driver, WAIT_TIME).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        return {
+            "salary": extract_salary(driver),
+            "job_type": extract_job_type(driver),
+            "location": extract_location(driver),
+        }
+    finally:
+        driver.close()
+        driver.switch_to.window(driver.window_handles[0])
+
+
+def bot_spec(
+    description: str,
+    chrome_args: tuple[str, ...] = (),
+    pause: Callable[[], None] = _no_pause,
+    on_open: Callable[[webdriver.Chrome], None] | None = None,
+    **overrides,
+) -> BotSpec:
+    """Return a :class:`BotSpec` built from the functions above.
+
+    ``chrome_args`` are used for every browser launch, ``pause`` and
+    ``on_open`` are passed to :func:`apply_to_job` (and ``pause`` to
+    :func:`snapshot_job`); ``overrides`` replace any field.
+    """
+    fields = {
+        "description": description,
+        "load_config": load_config,
+        "load_applied_jobs": load_applied_jobs,
+        "save_applied_job": save_applied_job,
+        "save_log": save_log,
+        "start_session": lambda url, args, timer: start_session(url, args, timer, chrome_args),
+        "restart_driver": lambda driver, reason: restart_driver(
+            driver, reason, lambda: setup_driver(chrome_args=chrome_args)
+        ),
+        "search": search_city,
+        "harvest": get_easy_apply_jobs,
+        "apply": lambda driver, job, city, cfg: apply_to_job(driver, job, city, cfg, pause, on_open),
+        "snapshot": lambda driver, job: snapshot_job(driver, job, pause),
+    }
+    fields.update(overrides)
+    return BotSpec(**fields)
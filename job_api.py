@@ -0,0 +1,388 @@
+"""Aggregator API job source used when scraping Indeed is not possible.
+
+The public Adzuna API is used as the provider. Requests go through a single
+pooled ``requests.Session`` with keep-alive and retry/backoff, responses are
+cached on disk with a TTL and revalidated with conditional requests, and
+results are mapped into the same job dict shape ``get_easy_apply_jobs()``
+produces so the rest of the bot can treat them like scraped cards.
+
+All endpoints and credentials come from the optional ``"api"`` section of
+``config.json``; pointing ``base_url`` at a local stub server is enough to
+exercise this module without network access.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Iterator
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import requests
+
+log = logging.getLogger(__name__)
+
+API_BASE_URL = "https://api.adzuna.com/v1/api/jobs"
+API_COUNTRY = "us"
+API_TIMEOUT = 10
+API_MAX_PAGES = 5
+API_RESULTS_PER_PAGE = 50
+API_CACHE_DIR = "api_cache"
+# Seconds a cached page is served without contacting the provider
+API_CACHE_TTL = 6 * 60 * 60
+API_USER_AGENT = "indeed-bot"
+# Concurrent in-flight requests during multi-city discovery
+API_CONCURRENCY = 4
+# Provider quota expressed as a token bucket (requests/second and burst size)
+API_RATE_PER_SECOND = 1.0
+API_RATE_BURST = 5
+
+# Adzuna names states in full; Indeed cards and ``locations`` use the code
+US_STATE_CODES = {
+    "Alabama": "AL", "Alaska": "AK", "Arizona": "AZ", "Arkansas": "AR", "California": "CA",
+    "Colorado": "CO", "Connecticut": "CT", "Delaware": "DE", "District of Columbia": "DC",
+    "Florida": "FL", "Georgia": "GA", "Hawaii": "HI", "Idaho": "ID", "Illinois": "IL",
+    "Indiana": "IN", "Iowa": "IA", "Kansas": "KS", "Kentucky": "KY", "Louisiana": "LA",
+    "Maine": "ME", "Maryland": "MD", "Massachusetts": "MA", "Michigan": "MI", "Minnesota": "MN",
+    "Mississippi": "MS", "Missouri": "MO", "Montana": "MT", "Nebraska": "NE", "Nevada": "NV",
+    "New Hampshire": "NH", "New Jersey": "NJ", "New Mexico": "NM", "New York": "NY",
+    "North Carolina": "NC", "North Dakota": "ND", "Ohio": "OH", "Oklahoma": "OK", "Oregon": "OR",
+    "Pennsylvania": "PA", "Rhode Island": "RI", "South Carolina": "SC", "South Dakota": "SD",
+    "Tennessee": "TN", "Texas": "TX", "Utah": "UT", "Vermont": "VT", "Virginia": "VA",
+    "Washington": "WA", "West Virginia": "WV", "Wisconsin": "WI", "Wyoming": "WY",
+}
+
+_SESSION: requests.Session | None = None
+
+
+def api_settings(cfg: dict | None = None) -> dict:
+    """Return the ``"api"`` config section merged over the module defaults."""
+    settings = {
+        "base_url": API_BASE_URL,
+        "country": API_COUNTRY,
+        "app_id": "YOUR_APP_ID",
+        "app_key": "YOUR_APP_KEY",
+        "timeout": API_TIMEOUT,
+        "max_pages": API_MAX_PAGES,
+        "results_per_page": API_RESULTS_PER_PAGE,
+        "cache_dir": API_CACHE_DIR,
+        "cache_ttl": API_CACHE_TTL,
+        "concurrency": API_CONCURRENCY,
+        "rate_per_second": API_RATE_PER_SECOND,
+        "rate_burst": API_RATE_BURST,
+    }
+    settings.update((cfg or {}).get("api", {}))
+    settings["base_url"] = settings["base_url"].rstrip("/")
+    return settings
+
+
+def create_api_session(pool_size: int = 10, retries: int = 3) -> requests.Session:
+    """Build a keep-alive session that retries transient failures with backoff."""
+    # Imported here so runs that never touch the API don't load requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": API_USER_AGENT, "Accept": "application/json"})
+    return session
+
+
+def get_api_session(pool_size: int = 10) -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = create_api_session(pool_size=pool_size)
+    return _SESSION
+
+
+def close_api_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+
+
+class ResponseCache:
+    """On-disk cache of JSON API responses with TTL and validators.
+
+    Each entry is stored as one JSON file named after a hash of the request
+    URL and parameters. Entries keep the ``ETag``/``Last-Modified`` headers
+    so stale pages can be revalidated with a conditional request instead of
+    being downloaded again.
+    """
+
+    def __init__(self, directory: str = API_CACHE_DIR, ttl: float = API_CACHE_TTL) -> None:
+        self.directory = directory
+        self.ttl = ttl
+
+    @staticmethod
+    def key(url: str, params: dict) -> str:
+        # Credentials are part of the query but must not split the cache
+        public = {k: v for k, v in sorted(params.items()) if k not in {"app_id", "app_key"}}
+        raw = url + "?" + json.dumps(public, sort_keys=True)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored entry for ``key`` or ``None``."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def put(self, key: str, body: dict, etag: str | None = None, last_modified: str | None = None) -> dict:
+        """Store a response atomically and return the new entry."""
+        entry = {
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+        return entry
+
+    def touch(self, key: str, entry: dict) -> dict:
+        """Mark a revalidated entry as fresh again."""
+        return self.put(key, entry["body"], entry.get("etag"), entry.get("last_modified"))
+
+
+def fetch_json(
+    url: str,
+    params: dict,
+    session: requests.Session | None = None,
+    cache: ResponseCache | None = None,
+    timeout: float = API_TIMEOUT,
+) -> dict | None:
+    """GET ``url`` and return its JSON body, using ``cache`` when possible."""
+    session = session or get_api_session()
+    key = ResponseCache.key(url, params) if cache else ""
+    entry = cache.get(key) if cache else None
+    if entry and cache.is_fresh(entry):
+        return entry["body"]
+
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = session.get(url, params=params, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and entry:
+        cache.touch(key, entry)
+        return entry["body"]
+    if resp.status_code != 200:
+        log.warning("API request failed: HTTP %s", resp.status_code)
+        return None
+    body = resp.json()
+    if cache:
+        cache.put(key, body, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+    return body
+
+
+def page_request(city: str, page: int, settings: dict) -> tuple[str, dict]:
+    """Return the ``(url, params)`` pair for one page of results in ``city``."""
+    url = f"{settings['base_url']}/{settings['country']}/search/{page}"
+    params = {
+        "app_id": settings["app_id"],
+        "app_key": settings["app_key"],
+        "where": city,
+        "results_per_page": settings["results_per_page"],
+        "content-type": "application/json",
+    }
+    return url, params
+
+
+def api_location(location: dict) -> str:
+    """Return an API location as "City, ST", like Indeed cards show it.
+
+    ``display_name`` reads "City, County", which never matches a target
+    city; ``area`` lists country, state, county and city.
+    """
+    area = location.get("area") or []
+    if len(area) >= 3:
+        return f"{area[-1]}, {US_STATE_CODES.get(area[1], area[1])}"
+    return location.get("display_name", "")
+
+
+def api_result_to_job(result: dict) -> dict | None:
+    """Map an API result into the job dict used by ``apply_to_job()``."""
+    jid = result.get("id")
+    link = result.get("redirect_url")
+    if not jid or not link:
+        return None
+    title = (result.get("title") or "").strip()
+    # Card-like text for scan screening; API salaries are yearly
+    snippet = [title]
+    if result.get("salary_min"):
+        snippet.append(f"${result['salary_min']:,.0f} a year")
+    if result.get("contract_time"):
+        snippet.append(result["contract_time"].replace("_", "-"))
+    if result.get("contract_type") == "contract":
+        snippet.append("contract")
+    return {
+        "id": f"api-{jid}",
+        "link": link,
+        "title": title,
+        "company": (result.get("company") or {}).get("display_name", ""),
+        "location": api_location(result.get("location") or {}),
+        "snippet": "\n".join(snippet),
+    }
+
+
+def iter_api_jobs(
+    city: str,
+    cfg: dict | None = None,
+    session: requests.Session | None = None,
+    cache: ResponseCache | None = None,
+) -> Iterator[dict]:
+    """Yield job dicts for ``city`` page by page until results run out."""
+    settings = api_settings(cfg)
+    if cache is None:
+        cache = ResponseCache(settings["cache_dir"], settings["cache_ttl"])
+    per_page = int(settings["results_per_page"])
+    for page in range(1, int(settings["max_pages"]) + 1):
+        url, params = page_request(city, page, settings)
+        body = fetch_json(url, params, session, cache, settings["timeout"])
+        results = (body or {}).get("results", [])
+        for result in results:
+            job = api_result_to_job(result)
+            if job:
+                yield job
+        total = (body or {}).get("count")
+        if len(results) < per_page or (total is not None and page * per_page >= total):
+            break
+
+
+class TokenBucket:
+    """Asyncio token bucket allowing ``rate`` acquisitions per second.
+
+    Up to ``capacity`` tokens accumulate while idle, so short bursts are
+    served immediately while the long-run rate never exceeds the quota.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def _fetch_page_async(
+    city: str,
+    page: int,
+    settings: dict,
+    session: requests.Session,
+    cache: ResponseCache,
+    limiter: TokenBucket,
+    semaphore: asyncio.Semaphore,
+) -> tuple[str, int, dict | None]:
+    url, params = page_request(city, page, settings)
+    async with semaphore:
+        entry = cache.get(ResponseCache.key(url, params))
+        if not entry or not cache.is_fresh(entry):
+            # Fresh cache hits don't count against the provider quota
+            await limiter.acquire()
+        try:
+            body = await asyncio.to_thread(
+                fetch_json, url, params, session, cache, settings["timeout"]
+            )
+        except Exception as exc:
+            log.warning("API search failed for %s page %s: %s", city, page, exc)
+            body = None
+    return city, page, body
+
+
+async def iter_api_jobs_concurrent(
+    cities: list[str],
+    cfg: dict | None = None,
+    seen: set[str] | None = None,
+    session: requests.Session | None = None,
+    cache: ResponseCache | None = None,
+) -> AsyncIterator[tuple[str, dict]]:
+    """Query every city and page concurrently, yielding ``(city, job)`` pairs.
+
+    The first page of each city is requested immediately; once its total
+    ``count`` is known the remaining pages are scheduled at once. Requests are
+    bounded by ``concurrency`` and the token bucket, and jobs are deduplicated
+    by ID across cities as pages arrive, so consumers can start working
+    before the slowest query finishes.
+    """
+    settings = api_settings(cfg)
+    concurrency = max(1, int(settings["concurrency"]))
+    session = session or get_api_session(pool_size=concurrency)
+    if cache is None:
+        cache = ResponseCache(settings["cache_dir"], settings["cache_ttl"])
+    limiter = TokenBucket(float(settings["rate_per_second"]), float(settings["rate_burst"]))
+    semaphore = asyncio.Semaphore(concurrency)
+    per_page = int(settings["results_per_page"])
+    max_pages = int(settings["max_pages"])
+    emitted = set(seen or ())
+
+    def schedule(city: str, page: int) -> asyncio.Task:
+        return asyncio.create_task(
+            _fetch_page_async(city, page, settings, session, cache, limiter, semaphore)
+        )
+
+    pending = {schedule(city, 1) for city in cities}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                city, page, body = task.result()
+                results = (body or {}).get("results", [])
+                total = (body or {}).get("count")
+                if page == 1 and total is not None:
+                    last = min(max_pages, -(-int(total) // per_page))
+                    pending.update(schedule(city, p) for p in range(2, last + 1))
+                elif total is None and len(results) >= per_page and page < max_pages:
+                    pending.add(schedule(city, page + 1))
+                for result in results:
+                    job = api_result_to_job(result)
+                    if job and job["id"] not in emitted:
+                        emitted.add(job["id"])
+                        yield city, job
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,59 @@
+"""The application log: one CSV row per job the bots evaluated.
+
+``LOG_FIELDS`` is the log's only schema definition; the bots write rows
+with :func:`save_log` and ``analytics.py`` reads them back.
+"""
+
+import csv
+import logging
+import os
+import shutil
+
+log = logging.getLogger(__name__)
+
+LOG_PATH = "applied_jobs_log.csv"
+LOG_FIELDS = [
+    "timestamp",
+    "job_title",
+    "company",
+    "city",
+    "distance",
+    "status",
+    "job_id",
+    "salary",
+    "reason",
+    "seconds",
+]
+
+
+def migrate_log_header(path: str, header: list[str]) -> list[str]:
+    """Add the missing ``LOG_FIELDS`` to an older log's header and return it.
+
+    New columns go after the existing ones, so old rows still line up and
+    simply leave them empty. The file is rewritten atomically.
+    """
+    columns = header + [name for name in LOG_FIELDS if name not in header]
+    tmp = path + ".tmp"
+    with open(path, "rb") as src, open(tmp, "w", newline="", encoding="utf-8") as dst:
+        src.readline()
+        csv.writer(dst).writerow(columns)
+        dst.flush()
+        shutil.copyfileobj(src, dst.buffer)
+    os.replace(tmp, path)
+    log.info("Added columns %s to %s", ", ".join(columns[len(header):]), path)
+    return columns
+
+
+def save_log(path: str, data: dict) -> None:
+    """Append one row to the log at ``path``, creating or migrating it first."""
+    header = None
+    if os.path.isfile(path) and os.path.getsize(path):
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f), None)
+        if header and not set(LOG_FIELDS) <= set(header):
+            header = migrate_log_header(path, header)
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=header or LOG_FIELDS, extrasaction="ignore")
+        if header is None:
+            writer.writeheader()
+        writer.writerow(data)
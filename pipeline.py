@@ -0,0 +1,490 @@
+"""Streaming job pipeline shared by the Indeed bots.
+
+Both bots run the same flow::
+
+    discover → dedupe → pre-filter → enrich → evaluate/apply → journal
+
+Discovery (searching and harvesting result pages) and evaluate/apply both
+drive the single browser, so they run serially on the main thread. The
+stages in between run on worker threads connected by bounded queues, so
+deduplication, card-level filtering and geocoding of a harvested page
+overlap with applying to the jobs that are already through. The journal
+(CSV log and applied-jobs file) is written by a background thread so disk
+I/O never holds up the browser.
+
+Everything a bot does differently — how it starts and logs into Chrome,
+how it searches, harvests and applies — is passed in as a :class:`BotSpec`,
+so each entry point is a thin configuration of :func:`run_bot`.
+"""
+
+import argparse
+import asyncio
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+from artifacts import close_recorder
+from bot_logging import log_context, setup_logging, stop_logging
+from checkpoint import MAX_RECOVERIES, Checkpoint, is_session_dead, start_or_resume
+from geocoding import calculate_distance, prefetch_locations, stop_prefetcher
+from job_log import LOG_PATH
+from startup import StartupTimer, build_search_url, parse_args
+from supervisor import RecycleSession, SessionSupervisor
+
+log = logging.getLogger(__name__)
+
+# Capacity of the queues between worker stages
+STAGE_QUEUE_SIZE = 32
+# Geocoding is rate limited, but a second worker keeps cache hits flowing
+ENRICH_WORKERS = 2
+# How often a streamed run checks whether discovery has finished
+STREAM_POLL_SECONDS = 0.5
+
+_STOP = object()
+
+
+class Dropped:
+    """Marker returned by :meth:`StagePipeline.results` for rejected items."""
+
+    __slots__ = ("item", "stage")
+
+    def __init__(self, item: Any, stage: str) -> None:
+        self.item = item
+        self.stage = stage
+
+
+class StagePipeline:
+    """Run item-by-item stages on worker threads joined by bounded queues.
+
+    ``stages`` is a list of ``(name, func, workers)``; ``func`` returns the
+    (possibly updated) item or ``None`` to drop it. Items are submitted in
+    batches, and every item of the current batch comes out of
+    :meth:`results` exactly once, either processed or as :class:`Dropped`.
+    Submitting a new batch discards whatever is left of the previous one.
+    Items whose number isn't known up front can be streamed into the
+    current batch with :meth:`add` and collected with :meth:`get`.
+    """
+
+    def __init__(self, stages: list[tuple[str, Callable, int]], maxsize: int = STAGE_QUEUE_SIZE) -> None:
+        self._batch = 0
+        # The first and last queues are unbounded so the browser thread never
+        # blocks on submit and finished items never stall the workers.
+        self._queues = (
+            [queue.Queue()]
+            + [queue.Queue(maxsize) for _ in stages[1:]]
+            + [queue.Queue()]
+        )
+        self._stages = stages
+        self._threads: list[list[threading.Thread]] = []
+        for index, (name, func, workers) in enumerate(stages):
+            group = []
+            for n in range(workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(name, func, self._queues[index], self._queues[index + 1]),
+                    name=f"{name}-{n}",
+                    daemon=True,
+                )
+                thread.start()
+                group.append(thread)
+            self._threads.append(group)
+
+    def _work(self, name: str, func: Callable, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        while True:
+            envelope = inbox.get()
+            if envelope is _STOP:
+                return
+            batch, item = envelope
+            if batch != self._batch:
+                continue
+            try:
+                with log_context(phase=name):
+                    result = func(item)
+            except Exception as exc:
+                log.warning("%s failed: %s", name, exc)
+                result = None
+            if result is None:
+                self._queues[-1].put((batch, Dropped(item, name)))
+            else:
+                outbox.put((batch, result))
+
+    def submit(self, items: list) -> int:
+        """Start a new batch and return how many results it will produce."""
+        self._batch += 1
+        for item in items:
+            self._queues[0].put((self._batch, item))
+        return len(items)
+
+    def add(self, item: Any) -> None:
+        """Add one more item to the current batch."""
+        self._queues[0].put((self._batch, item))
+
+    def get(self, timeout: float | None = None) -> Any:
+        """Return the next result of the current batch, or ``None`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                got, item = self._queues[-1].get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if got == self._batch:
+                return item
+
+    def results(self, count: int):
+        """Yield the ``count`` results of the current batch as they finish."""
+        batch = self._batch
+        received = 0
+        while received < count:
+            got, item = self._queues[-1].get()
+            if got != batch:
+                continue
+            received += 1
+            yield item
+
+    def close(self) -> None:
+        """Stop the workers stage by stage."""
+        self._batch += 1
+        for inbox, group in zip(self._queues, self._threads):
+            for _ in group:
+                inbox.put(_STOP)
+            for thread in group:
+                thread.join()
+
+
+class Journal(threading.Thread):
+    """Background writer for the application log and applied-jobs file."""
+
+    def __init__(self) -> None:
+        super().__init__(name="journal", daemon=True)
+        self._queue: queue.Queue = queue.Queue()
+        self.start()
+
+    def submit(self, func: Callable, *args) -> None:
+        self._queue.put((func, args))
+
+    def run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is _STOP:
+                return
+            func, args = entry
+            try:
+                func(*args)
+            except Exception as exc:
+                log.error("Journal write failed: %s", exc)
+
+    def close(self) -> None:
+        """Flush every pending write, then stop."""
+        self._queue.put(_STOP)
+        self.join()
+
+
+@dataclass
+class BotSpec:
+    """The parts of a bot that differ between entry points."""
+
+    description: str
+    load_config: Callable[[str, bool], dict]
+    load_applied_jobs: Callable[[], set]
+    save_applied_job: Callable[[str], None]
+    save_log: Callable[[str, dict], None]
+    # (start_url, args, timer) -> logged-in driver
+    start_session: Callable[[str, argparse.Namespace, StartupTimer], Any]
+    # (driver, reason) -> fresh logged-in driver
+    restart_driver: Callable[[Any, str], Any]
+    # (driver, city, cfg, seen, fast) -> API fallback jobs, or None if the page loaded
+    search: Callable[..., list | None]
+    # (driver, seen, cfg) -> job dicts from the current results page
+    harvest: Callable[[Any, set, dict], list]
+    # (driver, job, city, cfg) -> (status, distance)
+    apply: Callable[[Any, dict, str, dict], tuple]
+    # Optional coroutine (runner) used when cfg["search_mode"] == "api"
+    api_search: Callable[["Runner"], Any] | None = None
+    # Called with the driver before it is closed at the end of a run
+    shutdown: Callable[[Any], None] | None = None
+    # (driver, job) -> {"salary", "job_type", "location"} read from the job page
+    # without applying; used by --scan-details
+    snapshot: Callable[[Any, dict], dict] | None = None
+
+
+def scroll_results(driver) -> None:
+    """Scroll to the bottom of the results so more job cards load."""
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    time.sleep(2)
+
+
+def in_target_area(location: str, targets: list[str], loose: bool = False) -> bool:
+    """Return True if a card location is one of the target cities.
+
+    By default the location must equal a target exactly. With ``loose``
+    (``"loose_location_match"`` in config.json) it only has to start with
+    one, after any "Remote in " style prefix, so "Providence, RI 02903"
+    matches "Providence, RI" but "East Providence, RI" still does not.
+    """
+    if not location:
+        return True
+    if not loose:
+        return location in targets
+    text = location.lower().rsplit(" in ", 1)[-1].strip()
+    return any(text.startswith(target.lower()) for target in targets)
+
+
+class Runner:
+    """Drive one bot run: discovery, stages, applying and bookkeeping."""
+
+    def __init__(self, spec: BotSpec, cfg: dict, args: argparse.Namespace, timer: StartupTimer) -> None:
+        self.spec = spec
+        self.cfg = cfg
+        self.args = args
+        self.timer = timer
+        self.fast = args.fast or cfg.get("fast_start", False)
+        self.max_apps = cfg.get("max_applications", 50)
+        self.log_path = cfg.get("log_path", LOG_PATH)
+        self.applied_jobs = spec.load_applied_jobs()
+        self.state: Checkpoint = start_or_resume(cfg["locations"], args.resume)
+        self.supervisor = SessionSupervisor(cfg)
+        self.journal = Journal()
+        self._seen: set[str] = set()
+        self._seen_lock = threading.Lock()
+        self.stages = StagePipeline(
+            [
+                ("dedupe", self._dedupe, 1),
+                ("pre-filter", self._prefilter, 1),
+                ("enrich", self._enrich, ENRICH_WORKERS),
+            ]
+        )
+        self.driver = None
+
+    @property
+    def done(self) -> set[str]:
+        """IDs that must not be evaluated again in this run."""
+        return self.applied_jobs | self.state.processed
+
+    # Worker stages -----------------------------------------------------
+
+    def _dedupe(self, job: dict) -> dict | None:
+        with self._seen_lock:
+            if job["id"] in self._seen:
+                return None
+            self._seen.add(job["id"])
+        return job
+
+    def _prefilter(self, job: dict) -> dict | None:
+        if not in_target_area(
+            job.get("location", ""), self.cfg["locations"], self.cfg.get("loose_location_match", False)
+        ):
+            log.debug("Skipping job %s - outside target cities", job["id"])
+            return None
+        return job
+
+    def _enrich(self, job: dict) -> dict:
+        if job.get("location") and job.get("distance") is None:
+            # A copy, as the checkpoint may be serializing the queued dict
+            distance = calculate_distance(self.cfg.get("user_address", ""), job["location"])
+            return {**job, "distance": distance}
+        return job
+
+    # Browser stage -----------------------------------------------------
+
+    def apply_job(self, job: dict, city: str) -> str:
+        """Evaluate and apply to one job, then journal and checkpoint it."""
+        with log_context(job_id=job["id"], city=city, phase="evaluate"):
+            return self._apply_job(job, city)
+
+    def _apply_job(self, job: dict, city: str) -> str:
+        started = time.perf_counter()
+        status, dist = self.spec.apply(self.driver, job, city, self.cfg)
+        seconds = round(time.perf_counter() - started, 2)
+        if status == "Applied":
+            self.applied_jobs.add(job["id"])
+            self.journal.submit(self.spec.save_applied_job, job["id"])
+        self.journal.submit(
+            self.spec.save_log,
+            self.log_path,
+            {
+                "timestamp": datetime.utcnow().isoformat(),
+                "job_title": job["title"],
+                "company": job["company"],
+                "city": city,
+                "distance": dist,
+                "status": status,
+                "job_id": job["id"],
+                # Set by the bot's apply function when known
+                "salary": job.get("salary", ""),
+                "reason": job.get("reason", ""),
+                "seconds": seconds,
+            },
+        )
+        self.state.finish_job(job, status)
+        log.info("Remaining applications: %s/%s", self.max_apps - self.state.count, self.max_apps)
+        if self.state.count < self.max_apps:
+            self.supervisor.after_job(self.driver)
+        return status
+
+    def apply_pending(self, city: str) -> None:
+        """Stream the queued jobs through the stages and apply as they finish."""
+        with self._seen_lock:
+            self._seen = set(self.done)
+        count = self.stages.submit(list(self.state.pending))
+        for item in self.stages.results(count):
+            if isinstance(item, Dropped):
+                self.state.finish_job(item.item, "Filtered")
+                continue
+            if self.state.count >= self.max_apps:
+                break
+            self.apply_job(item, city)
+
+    async def apply_stream(self, jobs) -> None:
+        """Apply to jobs from an async stream of ``(city, job)`` pairs.
+
+        Jobs go through the same stages as harvested ones as soon as they
+        arrive, while the browser applies to those that come out in a
+        worker thread.
+        """
+        with self._seen_lock:
+            self._seen = set(self.done)
+        self.stages.submit([])
+        cities: dict[str, str] = {}
+        added = 0
+
+        async def feed() -> None:
+            nonlocal added
+            async for city, job in jobs:
+                if self.state.count >= self.max_apps:
+                    return
+                cities.setdefault(job["id"], city)
+                prefetch_locations([job.get("location", "")])
+                self.stages.add(job)
+                added += 1
+
+        feeder = asyncio.create_task(feed())
+        received = 0
+        try:
+            while self.state.count < self.max_apps:
+                if feeder.done() and received == added:
+                    break
+                item = await asyncio.to_thread(self.stages.get, STREAM_POLL_SECONDS)
+                if item is None:
+                    continue
+                received += 1
+                if isinstance(item, Dropped):
+                    self.state.finish_job(item.item, "Filtered")
+                    continue
+                await asyncio.to_thread(self.apply_job, item, cities[item["id"]])
+            if feeder.done():
+                # Re-raise a discovery error
+                feeder.result()
+        finally:
+            feeder.cancel()
+            await asyncio.gather(feeder, return_exceptions=True)
+
+    # Discovery ---------------------------------------------------------
+
+    def scroll_results(self) -> None:
+        scroll_results(self.driver)
+
+    def run_search(self) -> None:
+        """Search the remaining cities and apply until the budget is used up.
+
+        All progress is kept in the checkpoint, so calling this again after
+        a crash or a browser recycle continues where the previous call
+        stopped.
+        """
+        state = self.state
+        if self.cfg.get("search_mode") == "api" and self.spec.api_search:
+            self.timer.report()
+            asyncio.run(self.spec.api_search(self))
+            return
+
+        while state.city is not None and state.count < self.max_apps:
+            city = state.city
+            with log_context(city=city, phase="search"):
+                api_jobs = self.spec.search(self.driver, city, self.cfg, self.done, self.fast)
+            self.timer.mark("first search")
+            self.timer.report()
+            if api_jobs is not None:
+                # API results are already paginated; process them once
+                if not state.pending:
+                    state.queue_jobs(api_jobs)
+                self.apply_pending(city)
+            else:
+                # Restore the scroll position reached before a restart
+                for _ in range(state.page):
+                    self.scroll_results()
+                while state.count < self.max_apps:
+                    if not state.pending:
+                        with log_context(city=city, phase="harvest"):
+                            jobs = self.spec.harvest(self.driver, self.done, self.cfg)
+                        if not jobs:
+                            break
+                        state.queue_jobs(jobs)
+                        prefetch_locations(job["location"] for job in jobs)
+                    self.apply_pending(city)
+                    self.scroll_results()
+                    state.next_page()
+            if state.count >= self.max_apps:
+                break
+            state.next_city()
+
+    def run(self) -> None:
+        """Start the browser and run until done, restarting Chrome as needed."""
+        state = self.state
+        # Resolve the home address while Chrome starts
+        prefetch_locations([self.cfg.get("user_address", "")])
+        self.timer.mark("config")
+        start_url = build_search_url(state.city) if self.fast and state.city else "https://www.indeed.com"
+        self.driver = self.spec.start_session(start_url, self.args, self.timer)
+        log.info("Remaining applications: %s/%s", self.max_apps - state.count, self.max_apps)
+        recoveries = 0
+        try:
+            while True:
+                done = len(state.processed)
+                try:
+                    self.run_search()
+                    break
+                except RecycleSession as exc:
+                    self.driver = self.spec.restart_driver(self.driver, f"Recycling Chrome: {exc}")
+                except Exception as exc:
+                    if not is_session_dead(exc):
+                        raise
+                    recoveries = recoveries + 1 if len(state.processed) == done else 1
+                    if recoveries > MAX_RECOVERIES:
+                        log.error("Chrome keeps failing – stopping; rerun with --resume")
+                        raise
+                    self.driver = self.spec.restart_driver(self.driver, "WebDriver session lost")
+            state.clear()
+        finally:
+            self.stages.close()
+            self.journal.close()
+            stop_prefetcher()
+            close_recorder()
+            if self.spec.shutdown:
+                try:
+                    self.spec.shutdown(self.driver)
+                except Exception:
+                    pass
+            self.driver.quit()
+
+
+def run_bot(spec: BotSpec, argv: list[str] | None = None) -> None:
+    """Entry point shared by both bots."""
+    args = parse_args(argv, spec.description)
+    setup_logging(args.log_level, args.log_json, args.quiet, args.log_file)
+    timer = StartupTimer()
+    try:
+        log.info("Starting Indeed bot")
+        cfg = spec.load_config(args.config, not args.yes)
+        if args.scan:
+            # Imported here because scan builds on this module
+            from scan import Scanner
+
+            Scanner(spec, cfg, args, timer).run()
+        else:
+            Runner(spec, cfg, args, timer).run()
+    finally:
+        stop_logging()
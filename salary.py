@@ -0,0 +1,31 @@
+"""Salary parsing shared by the scanner and the log analytics.
+
+Kept free of other project imports so reading a salary never loads the
+browser pipeline or the geocoding cache.
+"""
+
+import re
+
+# Hours used to turn a salary quoted per period into an hourly wage
+PERIOD_HOURS = (("year", 2080), ("month", 173), ("week", 40), ("day", 8))
+
+
+def hourly_wage(text: str) -> float | None:
+    """Return the lower bound of a salary as an hourly wage."""
+    for line in (text or "").splitlines():
+        match = re.search(r"\$([\d,]+(?:\.\d+)?)([kK]\b)?", line)
+        if not match:
+            continue
+        try:
+            amount = float(match.group(1).replace(",", ""))
+        except ValueError:
+            return None
+        if match.group(2):
+            # "$45.3K" is shorthand for $45,300
+            amount *= 1000
+        lower = line.lower()
+        for period, hours in PERIOD_HOURS:
+            if period in lower:
+                return round(amount / hours, 2)
+        return amount
+    return None
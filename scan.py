@@ -0,0 +1,401 @@
+"""Scan-only mode: rank the jobs on offer without applying to any.
+
+``--scan`` searches every city in ``locations``, harvests a few result pages
+and screens each job on what its card shows: salary, job type, location
+and distance. With ``--scan-details`` jobs that pass are also opened to read
+the salary, type and location from their detail page, but Apply is never
+clicked. Results are written to ``scan_report.csv``, ``.jsonl`` and
+``.html``, best matches first. ``applied_jobs.txt`` is only read, to mark
+jobs already applied to.
+
+Decisions are cached in ``scan_cache.json`` by job id and a fingerprint of
+the card, so a repeated scan only screens, geocodes and opens new or
+changed jobs. Cached decisions are re-screened when the screening settings
+change. Settings come from the optional ``"scan"`` section of
+``config.json``::
+
+    "scan": {
+      "max_pages": 3,
+      "details": false,
+      "max_distance": 15,
+      "report_path": "scan_report",
+      "formats": ["csv", "jsonl", "html"]
+    }
+"""
+
+import argparse
+import csv
+import hashlib
+import html
+import json
+import logging
+import os
+import threading
+import time
+
+from bot_logging import log_context
+from geocoding import calculate_distance, prefetch_locations, stop_prefetcher
+from pipeline import ENRICH_WORKERS, BotSpec, Dropped, StagePipeline, in_target_area, scroll_results
+from salary import hourly_wage
+from startup import StartupTimer, build_search_url
+
+log = logging.getLogger(__name__)
+
+SCAN_CACHE_PATH = "scan_cache.json"
+SCAN_REPORT_PATH = "scan_report"
+SCAN_MAX_PAGES = 3
+REPORT_FORMATS = ("csv", "jsonl", "html")
+
+MATCH = "match"
+MAYBE = "maybe"
+REJECT = "reject"
+_DECISION_ORDER = {MATCH: 0, MAYBE: 1, REJECT: 2}
+
+JOB_TYPES = ("full-time", "part-time", "contract", "temporary", "internship")
+REJECTED_TYPES = {"contract", "temporary", "internship"}
+# Ranking: hourly wage, minus this many dollars per mile of distance
+DISTANCE_WEIGHT = 0.5
+KNOWN_TYPE_BONUS = 1.0
+
+REPORT_FIELDS = [
+    "rank",
+    "decision",
+    "score",
+    "title",
+    "company",
+    "location",
+    "distance",
+    "wage",
+    "salary",
+    "job_type",
+    "reasons",
+    "city",
+    "new",
+    "applied",
+    "link",
+    "id",
+]
+
+
+def scan_settings(cfg: dict) -> dict:
+    settings = {
+        "max_pages": SCAN_MAX_PAGES,
+        "details": False,
+        "max_distance": None,
+        "report_path": SCAN_REPORT_PATH,
+        "formats": list(REPORT_FORMATS),
+        "cache_path": SCAN_CACHE_PATH,
+    }
+    settings.update(cfg.get("scan", {}))
+    return settings
+
+
+def salary_line(text: str) -> str:
+    return next((line.strip() for line in (text or "").splitlines() if "$" in line), "")
+
+
+def card_job_type(text: str) -> str | None:
+    lower = (text or "").lower()
+    return next((kind for kind in JOB_TYPES if kind in lower), None)
+
+
+def screen(job: dict, cfg: dict, max_distance: float | None) -> dict:
+    """Set ``decision``, ``reasons`` and ``score`` on ``job`` from its facts."""
+    reasons = []
+    decision = MATCH
+    wage = job.get("wage")
+    job_type = job.get("job_type")
+    distance = job.get("distance")
+    if not in_target_area(job.get("location", ""), cfg["locations"], cfg.get("loose_location_match", False)):
+        decision, reasons = REJECT, reasons + ["outside target cities"]
+    if job_type in REJECTED_TYPES:
+        decision, reasons = REJECT, reasons + [f"job type is {job_type}"]
+    if wage is not None and wage < cfg.get("min_salary", 0):
+        decision, reasons = REJECT, reasons + [f"pay ${wage:g}/h below minimum"]
+    if distance is not None and max_distance is not None and distance > max_distance:
+        decision, reasons = REJECT, reasons + [f"{distance} miles away"]
+    if decision == MATCH:
+        if wage is None:
+            decision, reasons = MAYBE, reasons + ["salary not listed"]
+        if job_type is None:
+            decision, reasons = MAYBE, reasons + ["job type not listed"]
+    score = (wage or 0) - DISTANCE_WEIGHT * (distance or 0)
+    if job_type in {"full-time", "part-time"}:
+        score += KNOWN_TYPE_BONUS
+    job.update(decision=decision, reasons=reasons, score=round(score, 2))
+    return job
+
+
+def fingerprint(job: dict) -> str:
+    card = "\n".join(job.get(key) or "" for key in ("title", "company", "location", "snippet"))
+    return hashlib.sha1(card.encode("utf-8")).hexdigest()
+
+
+class ScanCache:
+    """Screened jobs from earlier scans, keyed by job id."""
+
+    def __init__(self, path: str, settings_hash: str) -> None:
+        self.path = path
+        self.settings_hash = settings_hash
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.jobs: dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self.jobs = {}
+
+    def get(self, job: dict) -> dict | None:
+        """Return the cached entry for ``job`` if its card is unchanged."""
+        with self._lock:
+            entry = self.jobs.get(job["id"])
+        if entry and entry.get("fingerprint") == fingerprint(job):
+            return entry
+        return None
+
+    def put(self, job: dict) -> None:
+        entry = {key: value for key, value in job.items() if key not in {"new", "applied", "city"}}
+        entry.update(fingerprint=fingerprint(job), settings=self.settings_hash, last_seen=time.time())
+        entry.setdefault("first_seen", entry["last_seen"])
+        with self._lock:
+            self.jobs[job["id"]] = entry
+
+    def save(self) -> None:
+        tmp = self.path + ".tmp"
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.jobs, f)
+        os.replace(tmp, self.path)
+
+
+def settings_hash(cfg: dict, settings: dict) -> str:
+    """Hash of every setting a decision depends on."""
+    relevant = [
+        cfg.get("min_salary"),
+        cfg["locations"],
+        cfg.get("loose_location_match", False),
+        cfg.get("user_address"),
+        settings["max_distance"],
+    ]
+    return hashlib.sha1(json.dumps(relevant).encode("utf-8")).hexdigest()
+
+
+def rank(rows: list[dict]) -> list[dict]:
+    rows = sorted(rows, key=lambda j: (_DECISION_ORDER[j["decision"]], -j["score"]))
+    for index, row in enumerate(rows, 1):
+        row["rank"] = index
+    return rows
+
+
+def _report_row(job: dict) -> dict:
+    row = {field: job.get(field, "") for field in REPORT_FIELDS}
+    row["reasons"] = "; ".join(job.get("reasons", []))
+    for field in ("distance", "wage"):
+        if row[field] is None:
+            row[field] = ""
+    return row
+
+
+def write_report(rows: list[dict], base_path: str, formats=REPORT_FORMATS) -> list[str]:
+    """Write the ranked rows in each of ``formats`` and return the paths."""
+    paths = []
+    if "csv" in formats:
+        path = base_path + ".csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(_report_row(job) for job in rows)
+        paths.append(path)
+    if "jsonl" in formats:
+        path = base_path + ".jsonl"
+        with open(path, "w", encoding="utf-8") as f:
+            for job in rows:
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+        paths.append(path)
+    if "html" in formats:
+        path = base_path + ".html"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_html_report(rows))
+        paths.append(path)
+    return paths
+
+
+def _html_report(rows: list[dict]) -> str:
+    columns = [f for f in REPORT_FIELDS if f not in {"link", "id"}]
+    head = "".join(f"<th>{html.escape(c)}</th>" for c in columns)
+    body = []
+    for job in rows:
+        row = _report_row(job)
+        cells = []
+        for column in columns:
+            value = html.escape(str(row[column]))
+            if column == "title" and job.get("link"):
+                value = f'<a href="{html.escape(job["link"])}">{value}</a>'
+            cells.append(f"<td>{value}</td>")
+        body.append(f'<tr class="{html.escape(job["decision"])}">{"".join(cells)}</tr>')
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Indeed scan</title>"
+        "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}"
+        ".match{background:#e6f4ea}.maybe{background:#fff8e1}.reject{color:#888}</style>"
+        f"</head><body><h1>Indeed scan – {time.strftime('%Y-%m-%d %H:%M')}</h1>"
+        f"<table><tr>{head}</tr>\n" + "\n".join(body) + "</table></body></html>\n"
+    )
+
+
+class Scanner:
+    """Search, harvest and screen jobs for every city, then write the report."""
+
+    def __init__(self, spec: BotSpec, cfg: dict, args: argparse.Namespace, timer: StartupTimer) -> None:
+        self.spec = spec
+        self.cfg = cfg
+        self.args = args
+        self.timer = timer
+        self.settings = scan_settings(cfg)
+        self.details = (args.scan_details or self.settings["details"]) and spec.snapshot is not None
+        self.fast = args.fast or cfg.get("fast_start", False)
+        self.cache = ScanCache(self.settings["cache_path"], settings_hash(cfg, self.settings))
+        # Read only: a scan never records applications
+        self.applied = spec.load_applied_jobs()
+        self._seen: set[str] = set()
+        self._seen_lock = threading.Lock()
+        self.stages = StagePipeline(
+            [
+                ("dedupe", self._dedupe, 1),
+                ("screen", self._screen, 1),
+                ("enrich", self._enrich, ENRICH_WORKERS),
+            ]
+        )
+        self.rows: list[dict] = []
+        self.driver = None
+
+    @property
+    def seen(self) -> set[str]:
+        with self._seen_lock:
+            return set(self._seen)
+
+    # Worker stages -----------------------------------------------------
+
+    def _dedupe(self, job: dict) -> dict | None:
+        with self._seen_lock:
+            if job["id"] in self._seen:
+                return None
+            self._seen.add(job["id"])
+        return job
+
+    def _screen(self, job: dict) -> dict:
+        cached = self.cache.get(job)
+        if cached:
+            # Keep facts read from the detail page; only the link may change
+            job = {**job, **cached, "link": job["link"], "new": False}
+            if cached.get("settings") == self.cache.settings_hash:
+                job["cached"] = True
+                return job
+        else:
+            job.update(
+                new=True,
+                salary=salary_line(job.get("snippet", "")),
+                wage=hourly_wage(job.get("snippet", "")),
+                job_type=card_job_type(job.get("snippet", "")),
+                distance=None,
+                detail=False,
+            )
+        job["cached"] = False
+        return screen(job, self.cfg, self.settings["max_distance"])
+
+    def _enrich(self, job: dict) -> dict:
+        if job["cached"] or job["decision"] == REJECT:
+            # Rejected jobs are never geocoded
+            return job
+        if job.get("location") and job.get("distance") is None:
+            job["distance"] = calculate_distance(self.cfg.get("user_address", ""), job["location"])
+        return screen(job, self.cfg, self.settings["max_distance"])
+
+    # Browser stage -----------------------------------------------------
+
+    def read_details(self, job: dict) -> None:
+        """Re-screen ``job`` with the facts from its detail page."""
+        try:
+            with log_context(job_id=job["id"], phase="snapshot"):
+                details = self.spec.snapshot(self.driver, job)
+        except Exception as exc:
+            log.warning("Could not read details for %s: %s", job["id"], exc)
+            return
+        job["detail"] = True
+        if details.get("salary"):
+            job["salary"] = details["salary"]
+            job["wage"] = hourly_wage(details["salary"])
+        kind = card_job_type(details.get("job_type") or "")
+        if kind:
+            job["job_type"] = kind
+        location = details.get("location")
+        if location and location != job.get("location"):
+            job["location"] = location
+            job["distance"] = calculate_distance(self.cfg.get("user_address", ""), location)
+        screen(job, self.cfg, self.settings["max_distance"])
+
+    def process(self, jobs: list[dict], city: str) -> None:
+        """Stream one page of jobs through the stages into the report."""
+        count = self.stages.submit(jobs)
+        for job in self.stages.results(count):
+            if isinstance(job, Dropped):
+                continue
+            if self.details and job["decision"] != REJECT and not job.get("detail"):
+                self.read_details(job)
+            job.pop("cached", None)
+            self.cache.put(job)
+            job["city"] = city
+            job["applied"] = job["id"] in self.applied
+            self.rows.append(job)
+            log.debug("%s: %s (%s)", job["decision"], job["title"], "; ".join(job["reasons"]))
+
+    # Discovery ---------------------------------------------------------
+
+    def scan_city(self, city: str) -> None:
+        with log_context(city=city, phase="search"):
+            api_jobs = self.spec.search(self.driver, city, self.cfg, self.seen, self.fast)
+        self.timer.mark("first search")
+        self.timer.report()
+        if api_jobs is not None:
+            self.process(api_jobs, city)
+            return
+        for page in range(self.settings["max_pages"]):
+            with log_context(city=city, phase="harvest"):
+                jobs = self.spec.harvest(self.driver, self.seen, self.cfg)
+            if not jobs:
+                break
+            prefetch_locations(job["location"] for job in jobs)
+            self.process(jobs, city)
+            if page + 1 < self.settings["max_pages"]:
+                scroll_results(self.driver)
+
+    def summary(self) -> str:
+        counts = {kind: sum(1 for j in self.rows if j["decision"] == kind) for kind in _DECISION_ORDER}
+        new = sum(1 for j in self.rows if j.get("new"))
+        return (
+            f"Scanned {len(self.rows)} jobs ({new} new): {counts[MATCH]} matches, "
+            f"{counts[MAYBE]} to check, {counts[REJECT]} rejected"
+        )
+
+    def run(self) -> None:
+        """Start the browser, scan every city and write the report."""
+        locations = self.cfg["locations"]
+        prefetch_locations([self.cfg.get("user_address", "")])
+        self.timer.mark("config")
+        start_url = build_search_url(locations[0]) if self.fast and locations else "https://www.indeed.com"
+        self.driver = self.spec.start_session(start_url, self.args, self.timer)
+        try:
+            for city in locations:
+                self.scan_city(city)
+        finally:
+            self.stages.close()
+            stop_prefetcher()
+            self.cache.save()
+            # A partial scan still gets a report
+            paths = write_report(rank(self.rows), self.settings["report_path"], self.settings["formats"])
+            log.info("%s – report in %s", self.summary(), ", ".join(paths))
+            if self.spec.shutdown:
+                try:
+                    self.spec.shutdown(self.driver)
+                except Exception:
+                    pass
+            self.driver.quit()
@@ -0,0 +1,115 @@
+"""Login session state for the Indeed bots.
+
+Saved cookies are checked for expiry before use and injected in a single
+DevTools call before Chrome opens its first page, so no reload is needed to
+pick them up. Login state is probed with one DOM lookup instead of waiting
+for a "Sign in" link that may never appear, and ``cookies.json`` is only
+rewritten when the browser's cookies actually changed.
+"""
+
+import json
+import logging
+import os
+import time
+
+log = logging.getLogger(__name__)
+
+COOKIES_PATH = "cookies.json"
+# Cookies Indeed sets for an authenticated session
+AUTH_COOKIE_NAMES = ("SOCK", "SHOE")
+INDEED_URL = "https://www.indeed.com"
+
+
+def read_cookies(path: str = COOKIES_PATH) -> list[dict]:
+    """Return the unexpired cookies saved in ``path``."""
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cookies = json.load(f)
+    except (OSError, ValueError):
+        log.warning("Saved cookies unreadable – log in manually")
+        return []
+    now = time.time()
+    live = [c for c in cookies if not c.get("expiry") or c["expiry"] > now]
+    expiry = login_expiry(live)
+    if expiry is None:
+        log.warning("Saved login cookies missing or expired – log in manually")
+    else:
+        days = (expiry - now) / 86400
+        log.info("Saved login valid for %.1f more days", days)
+    return live
+
+
+def login_expiry(cookies: list[dict]) -> float | None:
+    """Return when the earliest auth cookie expires, or ``None`` if absent.
+
+    Session cookies without an expiry are treated as lasting a day.
+    """
+    expiries = [
+        c.get("expiry") or time.time() + 86400
+        for c in cookies
+        if c.get("name") in AUTH_COOKIE_NAMES
+    ]
+    return min(expiries) if expiries else None
+
+
+def _to_cdp(cookie: dict) -> dict:
+    param = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain", ".indeed.com"),
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if cookie.get("expiry"):
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in {"Strict", "Lax", "None"}:
+        param["sameSite"] = cookie["sameSite"]
+    return param
+
+
+def inject_cookies(driver, cookies: list[dict]) -> None:
+    """Install ``cookies`` in the browser in one call.
+
+    Uses the DevTools ``Network.setCookies`` command, which works before any
+    page is loaded. Browsers without DevTools support fall back to visiting
+    Indeed and adding the cookies one by one.
+    """
+    if not cookies:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp(c) for c in cookies]})
+    except Exception:
+        driver.get(INDEED_URL)
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+    log.info("Loaded %s saved cookies", len(cookies))
+
+
+def _fingerprint(cookies: list[dict]) -> set[tuple]:
+    # A renewed expiry must be saved too, or read_cookies() drops a live login
+    return {(c.get("domain"), c.get("name"), c.get("value"), c.get("expiry")) for c in cookies}
+
+
+def save_cookies_if_changed(driver, path: str = COOKIES_PATH) -> bool:
+    """Write the browser's cookies to ``path`` if they differ from the file."""
+    cookies = driver.get_cookies()
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if _fingerprint(json.load(f)) == _fingerprint(cookies):
+                    return False
+        except (OSError, ValueError):
+            pass
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cookies, f, indent=2)
+    os.replace(tmp, path)
+    return True
+
+
+def is_logged_in(driver) -> bool:
+    """Return True unless the current page offers a "Sign in" link."""
+    return not driver.find_elements("link text", "Sign in")
@@ -0,0 +1,98 @@
+"""Command line handling and startup timing shared by the Indeed bots.
+
+This module only uses the standard library so it can be imported before
+Selenium and the other heavy dependencies are loaded.
+"""
+
+import argparse
+import logging
+import time
+from urllib.parse import urlencode
+
+log = logging.getLogger(__name__)
+
+SEARCH_URL = "https://www.indeed.com/jobs"
+
+
+def parse_args(argv: list[str] | None = None, description: str = "") -> argparse.Namespace:
+    """Parse the command line options common to both bots."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--config", default="config.json", help="path to the configuration file"
+    )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="run non-interactively: use the existing config and saved cookies without prompting",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="open search result URLs directly instead of going through the home page",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue from the last run checkpoint instead of starting over",
+    )
+    parser.add_argument(
+        "--scan",
+        action="store_true",
+        help="only search and screen jobs, writing a ranked report instead of applying",
+    )
+    parser.add_argument(
+        "--scan-details",
+        action="store_true",
+        help="with --scan, also read each promising job's detail page (never clicks Apply)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        help="minimum level to log: DEBUG shows every form field and skipped card (default INFO)",
+    )
+    parser.add_argument(
+        "--log-json", action="store_true", help="write console logs as JSON lines"
+    )
+    parser.add_argument("--log-file", help="also append JSON log lines to this file")
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only show warnings and errors on the console"
+    )
+    return parser.parse_args(argv)
+
+
+def build_search_url(city: str, start: int = 0) -> str:
+    """Return the Indeed results URL for a keyword-less search in ``city``."""
+    params = {"q": "", "l": city}
+    if start:
+        params["start"] = start
+    return f"{SEARCH_URL}?{urlencode(params)}"
+
+
+class StartupTimer:
+    """Record how long each startup phase takes and print a breakdown.
+
+    Call :meth:`mark` at the end of each phase; the phase's duration is the
+    time since the previous mark.
+    """
+
+    def __init__(self) -> None:
+        self.started = self.last = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+        self.reported = False
+
+    def mark(self, name: str) -> None:
+        if self.reported:
+            return
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def report(self) -> None:
+        """Print the breakdown once; later calls are ignored."""
+        if self.reported:
+            return
+        self.reported = True
+        total = time.perf_counter() - self.started
+        parts = ", ".join(f"{name} {secs:.2f}s" for name, secs in self.phases)
+        log.info("Startup: %s – ready in %.2fs", parts, total)
@@ -0,0 +1,128 @@
+"""Chrome session supervision for long runs.
+
+Between jobs the supervisor checks that the WebDriver session still answers
+and samples memory: the page's JS heap and DOM size through the DevTools
+``Performance`` domain and, when ``psutil`` is installed, the resident memory
+of every Chrome process started by the driver. Once a threshold is crossed
+it raises :class:`RecycleSession`; the bots then restart Chrome and continue
+from the run checkpoint, so the login and search position are preserved.
+"""
+
+import time
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optional dependency
+    psutil = None
+
+# Defaults for the optional "supervisor" section of config.json
+MAX_JS_HEAP_MB = 512
+MAX_BROWSER_MB = 3072
+MAX_DOM_NODES = 150000
+# Recycle after this many jobs or minutes even if memory looks fine (0 = never)
+MAX_SESSION_JOBS = 150
+MAX_SESSION_MINUTES = 0
+
+_MB = 1024 * 1024
+
+
+class RecycleSession(Exception):
+    """Raised between jobs when the browser should be restarted."""
+
+
+def performance_metrics(driver) -> dict[str, float]:
+    """Return the DevTools performance metrics of the current page."""
+    result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    return {m["name"]: m["value"] for m in result.get("metrics", [])}
+
+
+def browser_memory_mb(driver) -> float | None:
+    """Return the combined RSS of the Chrome processes behind ``driver``."""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root, *root.children(recursive=True)]
+    except Exception:
+        return None
+    total = 0
+    for proc in procs:
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / _MB
+
+
+class SessionSupervisor:
+    """Health-check and recycle the browser between applications."""
+
+    def __init__(self, cfg: dict | None = None) -> None:
+        settings = (cfg or {}).get("supervisor", {})
+        self.max_js_heap_mb = settings.get("max_js_heap_mb", MAX_JS_HEAP_MB)
+        self.max_browser_mb = settings.get("max_browser_mb", MAX_BROWSER_MB)
+        self.max_dom_nodes = settings.get("max_dom_nodes", MAX_DOM_NODES)
+        self.max_jobs = settings.get("max_session_jobs", MAX_SESSION_JOBS)
+        self.max_minutes = settings.get("max_session_minutes", MAX_SESSION_MINUTES)
+        self._driver_id: str | None = None
+        self.jobs = 0
+        self.started = time.monotonic()
+
+    def _attach(self, driver) -> None:
+        """Start tracking a new driver session."""
+        self._driver_id = driver.session_id
+        self.jobs = 0
+        self.started = time.monotonic()
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+        except Exception:
+            pass
+
+    def health_check(self, driver) -> None:
+        """Make sure the session answers and only the results tab is open.
+
+        Errors from a dead session propagate so the caller can restart it.
+        """
+        driver.execute_script("return 1")
+        handles = driver.window_handles
+        if len(handles) > 1:
+            # A failed application can leave its tab behind
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+    def sample(self, driver) -> dict[str, float]:
+        """Return the current memory figures in MB and DOM node count."""
+        stats: dict[str, float] = {}
+        try:
+            metrics = performance_metrics(driver)
+            stats["js_heap_mb"] = metrics.get("JSHeapUsedSize", 0) / _MB
+            stats["dom_nodes"] = metrics.get("Nodes", 0)
+        except Exception:
+            pass
+        browser = browser_memory_mb(driver)
+        if browser is not None:
+            stats["browser_mb"] = browser
+        return stats
+
+    def after_job(self, driver) -> None:
+        """Run between jobs; raise :class:`RecycleSession` when it is time."""
+        if driver.session_id != self._driver_id:
+            self._attach(driver)
+        self.jobs += 1
+        self.health_check(driver)
+        stats = self.sample(driver)
+        reason = None
+        if stats.get("js_heap_mb", 0) > self.max_js_heap_mb:
+            reason = f"JS heap at {stats['js_heap_mb']:.0f} MB"
+        elif stats.get("browser_mb", 0) > self.max_browser_mb:
+            reason = f"browser memory at {stats['browser_mb']:.0f} MB"
+        elif stats.get("dom_nodes", 0) > self.max_dom_nodes:
+            reason = f"{stats['dom_nodes']:.0f} DOM nodes"
+        elif self.max_jobs and self.jobs >= self.max_jobs:
+            reason = f"{self.jobs} jobs in this session"
+        elif self.max_minutes and time.monotonic() - self.started >= self.max_minutes * 60:
+            reason = f"session older than {self.max_minutes} minutes"
+        if reason:
+            raise RecycleSession(reason)
@@ -0,0 +1,35 @@
+"""Tests for folding the application log into the summary."""
+
+from analytics import update_summary
+
+OLD_LOG = (
+    "timestamp,job_title,company,city,distance,status\r\n"
+    '2026-09-01T10:00:00,"Cook, line",Diner,Lincoln,2,Applied\r\n'
+)
+NEW_LOG = (
+    "timestamp,job_title,company,city,distance,status,job_id,salary,reason,seconds\r\n"
+    "2026-10-02T10:00:00,Clerk,Shop,Providence,3,Skipped,j9,$50K a year,below minimum,4.5\r\n"
+)
+
+
+def test_mixed_headers_fold_by_their_own_columns(tmp_path):
+    log_path = tmp_path / "log.csv"
+    log_path.write_text(OLD_LOG + NEW_LOG, encoding="utf-8", newline="")
+    summary, added, replaced = update_summary(str(log_path), str(tmp_path / "summary.json"))
+    assert (added, replaced) == (2, False)
+    assert summary["status"] == {"Applied": 1, "Skipped": 1}
+    assert summary["reasons"] == {"Skipped: below minimum": 1}
+    assert summary["wage"] == {"Skipped": {"<25": 1}}
+    assert summary["seconds"]["Skipped"]["total"] == 4.5
+
+
+def test_appended_rows_are_read_incrementally(tmp_path):
+    log_path = tmp_path / "log.csv"
+    summary_path = str(tmp_path / "summary.json")
+    log_path.write_text(NEW_LOG, encoding="utf-8", newline="")
+    update_summary(str(log_path), summary_path)
+    with open(log_path, "a", encoding="utf-8", newline="") as f:
+        f.write("2026-10-03T10:00:00,Clerk,Shop,Providence,3,Applied,j10,,,12\r\n")
+    summary, added, replaced = update_summary(str(log_path), summary_path)
+    assert (added, replaced) == (1, False)
+    assert summary["rows"] == 2
@@ -0,0 +1,70 @@
+"""Tests for answering screener questions from the profile."""
+
+import json
+
+import pytest
+
+from answers import AnswerProfile
+
+
+@pytest.fixture
+def profile(tmp_path):
+    path = tmp_path / "answers.json"
+    path.write_text(
+        json.dumps(
+            {
+                "answers": {
+                    "years of customer service experience": "3",
+                    "authorized to work in the united states": "Yes",
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    return AnswerProfile(
+        str(path), str(tmp_path / "form_schemas.json"), str(tmp_path / "unanswered.json")
+    )
+
+
+def asked(text: str):
+    questions = []
+
+    def question() -> str:
+        questions.append(text)
+        return text
+
+    return question, questions
+
+
+def test_named_fields_are_learned_per_employer(profile):
+    question, _ = asked("How many years of customer service experience do you have?")
+    assert profile.resolve("Acme", "text", "q1", question) == "3"
+    again, questions = asked("ignored")
+    assert profile.resolve("Acme", "text", "q1", again) == "3"
+    assert questions == []
+
+
+def test_unnamed_fields_are_told_apart_by_question(profile):
+    years, _ = asked("Years of customer service experience")
+    auth, _ = asked("Are you authorized to work in the United States?")
+    assert profile.resolve("Acme", "text", "", years) == "3"
+    assert profile.resolve("Acme", "text", "", auth) == "Yes"
+    assert profile.resolve("Acme", "text", "", asked("Desired start date")[0]) is None
+    assert "text:" not in json.dumps(profile.schemas)
+
+
+def test_unknown_employer_is_not_learned(profile):
+    years, _ = asked("Years of customer service experience")
+    assert profile.resolve("", "text", "q1", years) == "3"
+    auth, questions = asked("Are you authorized to work in the United States?")
+    assert profile.resolve("", "text", "q1", auth) == "Yes"
+    assert questions
+    assert profile.schemas["employers"] == {}
+
+
+def test_broken_profile_falls_back_to_defaults(tmp_path):
+    path = tmp_path / "answers.json"
+    path.write_text('{"answers": {', encoding="utf-8")
+    profile = AnswerProfile(str(path), str(tmp_path / "s.json"), str(tmp_path / "u.json"))
+    assert profile.lookup("years of customer service experience") is None
+    assert profile.default("text") == "N/A"
@@ -0,0 +1,101 @@
+"""Tests for walking multi-step Easy Apply forms."""
+
+from apply_flow import CONFIRMATION_XPATH, CONTINUE_XPATH, REVIEW_XPATH, SUBMIT_XPATH, run_apply_flow
+
+
+class Element:
+    def __init__(self, text: str = "", on_click=None) -> None:
+        self.text = text
+        self.on_click = on_click
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        self.on_click()
+
+
+class Screen:
+    def __init__(self, heading: str, buttons: tuple[str, ...] = (), thanks: bool = False, url: str = "") -> None:
+        self.heading = heading
+        self.buttons = buttons
+        self.thanks = thanks
+        self.url = url or "https://www.indeed.com/apply/form"
+
+
+class FakeDriver:
+    """Shows ``screens`` in order; clicking any button moves to the next."""
+
+    def __init__(self, screens: list[Screen]) -> None:
+        self.screens = screens
+        self.index = 0
+        self.clicked: list[str] = []
+
+    @property
+    def screen(self) -> Screen:
+        return self.screens[self.index]
+
+    @property
+    def current_url(self) -> str:
+        return self.screen.url
+
+    def _button(self, label: str) -> Element:
+        def click():
+            self.clicked.append(label)
+            self.index = min(self.index + 1, len(self.screens) - 1)
+
+        return Element(label, click)
+
+    def find_elements(self, by: str, selector: str) -> list:
+        screen = self.screen
+        if selector == SUBMIT_XPATH:
+            return [self._button(b) for b in screen.buttons if b == "Submit"]
+        if selector == CONTINUE_XPATH:
+            return [self._button(b) for b in screen.buttons if b in {"Continue", "Next", "Review"}]
+        if selector == REVIEW_XPATH:
+            return [Element(screen.heading)] if "review" in screen.heading.lower() else []
+        if selector == CONFIRMATION_XPATH:
+            return [Element("Thank you for applying")] if screen.thanks else []
+        if selector == "//h1 | //h2 | //legend":
+            return [Element(screen.heading)]
+        return []
+
+
+def apply(driver: FakeDriver, **kwargs) -> str:
+    return run_apply_flow(driver, lambda d: None, step_wait=0.05, **kwargs)
+
+
+def test_confirmation_text_before_submit_is_not_applied():
+    # A job description that thanks the reader, then a page with no buttons
+    driver = FakeDriver([Screen("Cashier", ("Continue",), thanks=True), Screen("Cashier", thanks=True)])
+    assert apply(driver) == "Error"
+    assert driver.clicked == ["Continue"]
+
+
+def test_continue_review_submit_confirmation_is_applied():
+    driver = FakeDriver(
+        [
+            Screen("Contact info", ("Continue",)),
+            Screen("Questions", ("Review",)),
+            Screen("Please review your application", ("Submit",)),
+            Screen("Done", thanks=True),
+        ]
+    )
+    assert apply(driver) == "Applied"
+    assert driver.clicked == ["Continue", "Review", "Submit"]
+
+
+def test_post_apply_url_counts_as_confirmation():
+    driver = FakeDriver(
+        [Screen("Questions", ("Submit",)), Screen("Next steps", url="https://www.indeed.com/post-apply")]
+    )
+    assert apply(driver) == "Applied"
+
+
+def test_max_steps_is_an_error():
+    driver = FakeDriver([Screen(f"Step {n}", ("Continue",)) for n in range(6)])
+    assert apply(driver, max_steps=3) == "Error"
+    assert len(driver.clicked) == 3
@@ -0,0 +1,114 @@
+"""Tests for evaluating and applying to a job page."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import indeed_site
+from apply_flow import CONFIRMATION_XPATH, SUBMIT_XPATH
+
+NoSuchElementException = pytest.importorskip("selenium.common.exceptions").NoSuchElementException
+
+
+class Element:
+    def __init__(self, text: str = "", on_click=None) -> None:
+        self.text = text
+        self.on_click = on_click
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        if self.on_click:
+            self.on_click()
+
+
+class JobPage:
+    """A job tab with an Easy Apply form of one Submit step."""
+
+    window_handles = ["results", "job"]
+    current_url = "https://www.indeed.com/viewjob"
+    page_source = ""
+
+    def __init__(self, salary: str) -> None:
+        self.salary = salary
+        self.step = "job"
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+        self.closed = False
+
+    def execute_script(self, *args):
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+    def _go(self, step: str):
+        return lambda: setattr(self, "step", step)
+
+    def find_element(self, by: str, selector: str):
+        if selector == "body":
+            return Element()
+        if "Job Type" in selector:
+            return Element("Full-time")
+        if selector == ".salary-snippet":
+            return Element(self.salary)
+        if selector.startswith(".jobsearch") or selector == ".companyLocation":
+            return Element("Pawtucket, RI")
+        if "contains(., 'Apply')" in selector and self.step == "job":
+            return Element("Apply now", self._go("form"))
+        raise NoSuchElementException(selector)
+
+    def find_elements(self, by: str, selector: str) -> list:
+        if selector == SUBMIT_XPATH and self.step == "form":
+            return [Element("Submit", self._go("done"))]
+        if selector == CONFIRMATION_XPATH and self.step == "done":
+            return [Element("Thank you for applying")]
+        if selector == "//h1 | //h2 | //legend":
+            return [Element(self.step)]
+        return []
+
+
+JOB = {"id": "1", "link": "https://www.indeed.com/viewjob?jk=1", "title": "Clerk", "company": "Shop",
+       "location": "Pawtucket, RI", "distance": 2.5}
+CFG = {"min_salary": 17, "resume_path": "", "user_address": "123 Main Street, Pawtucket, RI"}
+
+
+@pytest.fixture(autouse=True)
+def in_tmp(tmp_path, monkeypatch):
+    # The answer profile and its caches are read from the working directory
+    monkeypatch.chdir(tmp_path)
+    indeed_site.load_selenium()
+
+
+def test_apply_uses_the_hooks():
+    page = JobPage("$20 an hour")
+    pauses, opened = [], []
+    status, distance = indeed_site.apply_to_job(
+        page, dict(JOB), "Pawtucket, RI", CFG, lambda: pauses.append(page.step), opened.append
+    )
+    assert (status, distance) == ("Applied", 2.5)
+    assert opened == [page]
+    assert pauses
+    assert page.closed
+
+
+def test_yearly_salary_below_minimum_is_skipped():
+    page = JobPage("$30,000 a year")
+    job = dict(JOB)
+    assert indeed_site.apply_to_job(page, job, "Pawtucket, RI", CFG) == ("Skipped", None)
+    assert job["reason"] == "salary too low"
+    assert page.step == "job"
+
+
+def test_bot_spec_overrides_only_what_is_given():
+    def search(*args):
+        return []
+
+    spec = indeed_site.bot_spec("test", search=search)
+    assert spec.search is search
+    assert spec.harvest is indeed_site.get_easy_apply_jobs
+    assert spec.load_config is indeed_site.load_config
+    assert spec.api_search is None
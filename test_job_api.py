@@ -0,0 +1,142 @@
+"""Tests for the API client against a local stub of the provider."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from job_api import (
+    ResponseCache,
+    api_location,
+    api_result_to_job,
+    create_api_session,
+    fetch_json,
+    iter_api_jobs,
+)
+from pipeline import in_target_area
+
+TOTAL_JOBS = 5
+ETAG = '"v1"'
+
+
+def make_result(n: int) -> dict:
+    return {
+        "id": str(n),
+        "redirect_url": f"https://example.com/job/{n}",
+        "title": f" Job {n} ",
+        "company": {"display_name": "Acme"},
+        "location": {
+            "display_name": "Pawtucket, Providence County",
+            "area": ["US", "Rhode Island", "Providence County", "Pawtucket"],
+        },
+        "salary_min": 41600,
+        "contract_time": "full_time",
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        page = int(url.path.rsplit("/", 1)[-1])
+        self.server.requests.append((page, query, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        per_page = int(query["results_per_page"][0])
+        first = (page - 1) * per_page
+        results = [make_result(n) for n in range(first, min(first + per_page, TOTAL_JOBS))]
+        body = json.dumps({"count": TOTAL_JOBS, "results": results}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session():
+    session = create_api_session(retries=0)
+    yield session
+    session.close()
+
+
+def stub_cfg(server, tmp_path, **overrides) -> dict:
+    api = {
+        "base_url": f"http://127.0.0.1:{server.server_address[1]}",
+        "app_id": "id",
+        "app_key": "key",
+        "results_per_page": 2,
+        "max_pages": 10,
+        "cache_dir": str(tmp_path / "cache"),
+    }
+    api.update(overrides)
+    return {"api": api}
+
+
+def test_pagination_stops_at_count(stub, session, tmp_path):
+    jobs = list(iter_api_jobs("Pawtucket, RI", stub_cfg(stub, tmp_path), session))
+    assert [job["id"] for job in jobs] == [f"api-{n}" for n in range(TOTAL_JOBS)]
+    # 5 results at 2 per page: pages 1-3 and nothing after
+    assert [page for page, _, _ in stub.requests] == [1, 2, 3]
+
+
+def test_not_modified_serves_cached_body(stub, session, tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"), ttl=0)
+    url = f"http://127.0.0.1:{stub.server_address[1]}/us/search/1"
+    params = {"app_id": "id", "app_key": "key", "where": "Pawtucket, RI", "results_per_page": 2}
+    first = fetch_json(url, params, session, cache)
+    second = fetch_json(url, params, session, cache)
+    assert second == first
+    assert len(second["results"]) == 2
+    # The stale entry was revalidated instead of downloaded again
+    assert [etag for _, _, etag in stub.requests] == [None, ETAG]
+
+
+def test_cache_key_ignores_credentials():
+    url = "http://127.0.0.1/us/search/1"
+    params = {"where": "Pawtucket, RI", "results_per_page": 50}
+    key = ResponseCache.key(url, {**params, "app_id": "a", "app_key": "b"})
+    assert key == ResponseCache.key(url, {**params, "app_id": "c", "app_key": "d"})
+    assert key == ResponseCache.key(url, params)
+    assert key != ResponseCache.key(url, {**params, "where": "Providence, RI"})
+
+
+def test_api_result_matches_harvest_shape():
+    job = api_result_to_job(make_result(7))
+    assert set(job) == {"id", "link", "title", "company", "location", "snippet"}
+    assert job["id"] == "api-7"
+    assert job["link"] == "https://example.com/job/7"
+    assert job["title"] == "Job 7"
+    assert job["company"] == "Acme"
+    assert job["location"] == "Pawtucket, RI"
+    assert api_result_to_job({"id": "8"}) is None
+
+
+def test_api_jobs_pass_the_city_filter(stub, session, tmp_path):
+    jobs = list(iter_api_jobs("Pawtucket, RI", stub_cfg(stub, tmp_path), session))
+    assert jobs
+    assert all(in_target_area(job["location"], ["Pawtucket, RI"]) for job in jobs)
+
+
+def test_api_location_without_city_keeps_display_name():
+    assert api_location({"display_name": "Rhode Island, US", "area": ["US", "Rhode Island"]}) == "Rhode Island, US"
+    assert api_location({}) == ""
@@ -0,0 +1,69 @@
+"""Tests for writing the application log."""
+
+import csv
+
+from job_log import LOG_FIELDS, migrate_log_header, save_log
+
+OLD_HEADER = ["timestamp", "job_title", "company", "city", "distance", "status"]
+ROW = {
+    "timestamp": "2026-10-02T10:00:00",
+    "job_title": "Clerk",
+    "company": "Shop",
+    "city": "Providence, RI",
+    "distance": 3.0,
+    "status": "Skipped",
+    "job_id": "j9",
+    "salary": "$50K a year",
+    "reason": "below minimum",
+    "seconds": 4.5,
+}
+
+
+def read_rows(path) -> list[list[str]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_new_log_gets_every_column(tmp_path):
+    path = tmp_path / "log.csv"
+    save_log(str(path), ROW)
+    header, row = read_rows(path)
+    assert header == LOG_FIELDS
+    assert dict(zip(header, row))["reason"] == "below minimum"
+
+
+def test_migrate_log_header_keeps_old_rows(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text(
+        ",".join(OLD_HEADER) + '\r\n2026-09-01T10:00:00,"Cook, line",Diner,Lincoln,2,Applied\r\n',
+        encoding="utf-8",
+        newline="",
+    )
+    columns = migrate_log_header(str(path), OLD_HEADER)
+    assert columns == LOG_FIELDS
+    header, old = read_rows(path)
+    assert header == LOG_FIELDS
+    assert old == ["2026-09-01T10:00:00", "Cook, line", "Diner", "Lincoln", "2", "Applied"]
+    assert not (tmp_path / "log.csv.tmp").exists()
+
+
+def test_save_log_migrates_once_and_keeps_new_columns(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text(",".join(OLD_HEADER) + "\r\n", encoding="utf-8", newline="")
+    save_log(str(path), ROW)
+    save_log(str(path), {**ROW, "job_id": "j10"})
+    header, first, second = read_rows(path)
+    assert header == LOG_FIELDS
+    assert [dict(zip(header, r))["job_id"] for r in (first, second)] == ["j9", "j10"]
+    assert dict(zip(header, first))["salary"] == "$50K a year"
+
+
+def test_unknown_columns_are_kept_in_place(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("timestamp,status,note\r\n2026-09-01T10:00:00,Applied,hand-added\r\n", encoding="utf-8", newline="")
+    save_log(str(path), ROW)
+    header, old, new = read_rows(path)
+    assert header[:3] == ["timestamp", "status", "note"]
+    assert set(LOG_FIELDS) <= set(header)
+    assert old == ["2026-09-01T10:00:00", "Applied", "hand-added"]
+    assert dict(zip(header, new))["status"] == "Skipped"
@@ -0,0 +1,49 @@
+"""Tests for the shared pipeline helpers."""
+
+import pytest
+
+import pipeline
+from pipeline import Dropped, Runner, StagePipeline, in_target_area
+
+TARGETS = ["Providence, RI", "Pawtucket, RI"]
+
+
+@pytest.mark.parametrize(
+    "location, exact, loose",
+    [
+        ("Providence, RI", True, True),
+        ("", True, True),
+        ("Providence, RI 02903", False, True),
+        ("Remote in Pawtucket, RI", False, True),
+        ("East Providence, RI", False, False),
+        ("North Providence, RI", False, False),
+        ("Boston, MA", False, False),
+    ],
+)
+def test_in_target_area(location, exact, loose):
+    assert in_target_area(location, TARGETS) is exact
+    assert in_target_area(location, TARGETS, loose=True) is loose
+
+
+def test_streamed_items_join_the_current_batch():
+    stages = StagePipeline([("double", lambda n: n * 2, 1), ("odd", lambda n: n if n % 4 else None, 2)])
+    try:
+        stages.submit([])
+        for n in range(4):
+            stages.add(n)
+        results = [stages.get(timeout=5) for _ in range(4)]
+        assert sorted(r for r in results if not isinstance(r, Dropped)) == [2, 6]
+        assert sorted(r.item for r in results if isinstance(r, Dropped)) == [0, 4]
+        assert stages.get(timeout=0.05) is None
+    finally:
+        stages.close()
+
+
+def test_enrich_leaves_the_queued_job_alone(monkeypatch):
+    monkeypatch.setattr(pipeline, "calculate_distance", lambda origin, location: 4.2)
+    runner = Runner.__new__(Runner)
+    runner.cfg = {"user_address": "123 Main Street, Pawtucket, RI"}
+    queued = {"id": "1", "location": "Providence, RI"}
+    enriched = runner._enrich(queued)
+    assert enriched == {"id": "1", "location": "Providence, RI", "distance": 4.2}
+    assert "distance" not in queued
@@ -0,0 +1,38 @@
+"""Tests for the salary parsing used to screen jobs."""
+
+import pytest
+
+from indeed_site import meets_salary_requirement
+from salary import hourly_wage
+
+
+@pytest.mark.parametrize(
+    "text, wage",
+    [
+        ("$18 an hour", 18.0),
+        ("$17.50 - $19 an hour", 17.5),
+        ("$41,600 - $50,000 a year", 20.0),
+        ("$50K - $60K a year", 24.04),
+        ("Estimated $45.3k - $57.4k a year", 21.78),
+        ("$800 a week", 20.0),
+        ("Full-time\n$3,460 a month", 20.0),
+        ("No salary listed", None),
+        ("", None),
+    ],
+)
+def test_hourly_wage(text, wage):
+    assert hourly_wage(text) == wage
+
+
+@pytest.mark.parametrize(
+    "text, meets",
+    [
+        ("$30,000 a year", False),
+        ("$41,600 a year", True),
+        ("$16.50 an hour", False),
+        ("$17 an hour", True),
+        ("Pay not listed", False),
+    ],
+)
+def test_apply_uses_the_hourly_minimum(text, meets):
+    assert meets_salary_requirement(text, 17) is meets
@@ -0,0 +1,29 @@
+"""Tests for saving the browser's login cookies."""
+
+import json
+
+from session_state import save_cookies_if_changed
+
+
+class CookieDriver:
+    def __init__(self, cookies: list[dict]) -> None:
+        self.cookies = cookies
+
+    def get_cookies(self) -> list[dict]:
+        return self.cookies
+
+
+def test_cookies_saved_only_when_changed(tmp_path):
+    path = str(tmp_path / "cookies.json")
+    cookie = {"domain": ".indeed.com", "name": "SOCK", "value": "abc", "expiry": 1000}
+    assert save_cookies_if_changed(CookieDriver([cookie]), path)
+    assert not save_cookies_if_changed(CookieDriver([dict(cookie)]), path)
+
+
+def test_renewed_expiry_is_saved(tmp_path):
+    path = str(tmp_path / "cookies.json")
+    cookie = {"domain": ".indeed.com", "name": "SOCK", "value": "abc", "expiry": 1000}
+    save_cookies_if_changed(CookieDriver([cookie]), path)
+    assert save_cookies_if_changed(CookieDriver([{**cookie, "expiry": 2000}]), path)
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)[0]["expiry"] == 2000